@@ -25,6 +25,7 @@ from pathlib import Path
 from datetime import datetime
 import re
 from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 # Add modules directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -209,69 +210,94 @@ class AINotesGenerator:
             'errors': []
         }
         
-        for folder_info in folders:
-            try:
-                folder_path = folder_info['folder_path']
-                folder_name = folder_info['folder_name']
-                videos = folder_info['videos']
-                folder_date = folder_info['date']
-                
-                if not folder_date:
-                    self.logger.warning(f"Could not extract date from folder: {folder_name}")
-                    continue
-                
-                # Check if notes file already exists
-                if not force and self._notes_file_exists(folder_path, folder_date):
-                    self.logger.info(f"Notes file already exists for {folder_name}, skipping (use --force to regenerate)")
-                    self.stats['notes_files_skipped'] += 1
-                    continue
-                
-                if dry_run:
-                    self.logger.info(f"[DRY RUN] Would analyze {len(videos)} videos in {folder_name}")
-                    continue
-                
-                self.logger.info(f"Analyzing {len(videos)} videos in {folder_name}")
-                
-                # Analyze videos in this folder
-                video_analyses = []
-                for video in videos:
-                    try:
-                        analysis_result = self.video_analyzer.analyze_video(video['path'], dry_run=False)
-                        
-                        if analysis_result.get('analyzed', False):
-                            video_analyses.append({
-                                'filename': video['name'],
-                                'analysis_result': analysis_result
-                            })
-                            
-                            self.stats['videos_analyzed'] += 1
-                            
-                            if analysis_result.get('is_kung_fu', False):
-                                self.stats['kung_fu_detected'] += 1
-                        else:
-                            self.logger.warning(f"Failed to analyze {video['name']}: {analysis_result.get('reason', 'Unknown error')}")
+        # Analyses run on a small pool so one video's FFmpeg thumbnail extraction overlaps
+        # the previous video's AI request; notes are still written folder by folder
+        max_workers = max(1, int(self.config['ai_settings'].get('max_concurrent_analyses', 2)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Queue every folder's analyses up front, so the pool never idles between folders
+            queued_folders = []
+            for folder_info in folders:
+                try:
+                    folder_name = folder_info['folder_name']
+                    videos = folder_info['videos']
+                    folder_date = folder_info['date']
+                    
+                    if not folder_date:
+                        self.logger.warning(f"Could not extract date from folder: {folder_name}")
+                        continue
+                    
+                    # Check if notes file already exists
+                    if not force and self._notes_file_exists(folder_info['folder_path'], folder_date):
+                        self.logger.info(f"Notes file already exists for {folder_name}, skipping (use --force to regenerate)")
+                        self.stats['notes_files_skipped'] += 1
+                        continue
+                    
+                    if dry_run:
+                        self.logger.info(f"[DRY RUN] Would analyze {len(videos)} videos in {folder_name}")
+                        continue
+                    
+                    analysis_futures = [
+                        executor.submit(self.video_analyzer.analyze_video, video['path'], dry_run=False)
+                        for video in videos
+                    ]
+                    queued_folders.append((folder_info, analysis_futures))
+                    
+                except Exception as e:
+                    self._record_folder_error(results, folder_info, e)
+            
+            for folder_info, analysis_futures in queued_folders:
+                try:
+                    folder_path = folder_info['folder_path']
+                    folder_name = folder_info['folder_name']
+                    videos = folder_info['videos']
+                    folder_date = folder_info['date']
+                    
+                    self.logger.info(f"Analyzing {len(videos)} videos in {folder_name}")
+                    
+                    # Collect the analyses of this folder's videos, in folder order
+                    video_analyses = []
+                    for video, analysis_future in zip(videos, analysis_futures):
+                        try:
+                            analysis_result = analysis_future.result()
                             
-                    except Exception as e:
-                        self.logger.error(f"Error analyzing video {video['name']}: {e}")
-                        self.stats['errors'] += 1
-                
-                # Generate notes file
-                if video_analyses:
-                    self._create_notes_file(folder_path, folder_date, video_analyses)
-                    self.stats['notes_files_created'] += 1
-                    results['notes_created'] += 1
-                
-                results['folders_processed'] += 1
-                
-            except Exception as e:
-                error_msg = f"Error processing folder {folder_info.get('folder_name', 'unknown')}: {e}"
-                self.logger.error(error_msg)
-                results['errors'].append(error_msg)
-                self.stats['errors'] += 1
-                results['success'] = False
+                            if analysis_result.get('analyzed', False):
+                                video_analyses.append({
+                                    'filename': video['name'],
+                                    'analysis_result': analysis_result
+                                })
+                                
+                                self.stats['videos_analyzed'] += 1
+                                
+                                if analysis_result.get('is_kung_fu', False):
+                                    self.stats['kung_fu_detected'] += 1
+                            else:
+                                self.logger.warning(f"Failed to analyze {video['name']}: {analysis_result.get('reason', 'Unknown error')}")
+                                
+                        except Exception as e:
+                            self.logger.error(f"Error analyzing video {video['name']}: {e}")
+                            self.stats['errors'] += 1
+                    
+                    # Generate notes file
+                    if video_analyses:
+                        self._create_notes_file(folder_path, folder_date, video_analyses)
+                        self.stats['notes_files_created'] += 1
+                        results['notes_created'] += 1
+                    
+                    results['folders_processed'] += 1
+                    
+                except Exception as e:
+                    self._record_folder_error(results, folder_info, e)
         
         return results
     
+    def _record_folder_error(self, results: Dict[str, Any], folder_info: Dict[str, Any], error: Exception):
+        """Log and count an error processing a folder"""
+        error_msg = f"Error processing folder {folder_info.get('folder_name', 'unknown')}: {error}"
+        self.logger.error(error_msg)
+        results['errors'].append(error_msg)
+        self.stats['errors'] += 1
+        results['success'] = False
+    
     def _create_notes_file(self, folder_path: str, folder_date: datetime, 
                           video_analyses: List[Dict[str, Any]]):
         """Create notes file for a folder"""
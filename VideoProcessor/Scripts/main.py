@@ -70,6 +70,12 @@ Examples:
         help='Save results to JSON file'
     )
     
+    parser.add_argument(
+        '--rebuild-cache',
+        action='store_true',
+        help='Rescan every target folder instead of reusing the saved deduplication cache'
+    )
+    
     return parser.parse_args()
 
 def print_banner():
@@ -195,6 +201,8 @@ def main():
         # Initialize unified processor
         print("Initializing unified processor...")
         processor = UnifiedProcessor(config, logger)
+        if args.rebuild_cache:
+            processor.deduplication.invalidate_persisted_cache()
 
         # Run tests or full processing
         if args.test:
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for the Bloom filter prefilter
+Tests BloomFilter membership and the DeduplicationManager flexible-match prefilter
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+# Add the parent directory to Python path so we can import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.bloom_filter import BloomFilter
+from modules.deduplication import DeduplicationManager, CachedFile
+
+def test_bloom_filter_membership():
+    """Every added key must be reported present; unseen keys mostly absent"""
+    print("\n=== Testing BloomFilter membership ===")
+
+    bloom = BloomFilter(capacity=10000, error_rate=0.001)
+    for i in range(10000):
+        bloom.add(f"file_{i}.mp4|{i}")
+
+    missing = [i for i in range(10000) if f"file_{i}.mp4|{i}" not in bloom]
+    if missing:
+        print(f"❌ False negatives found: {len(missing)}")
+        return False
+    print("✅ No false negatives for 10000 added keys")
+
+    false_positives = sum(1 for i in range(10000, 60000) if f"file_{i}.mp4|{i}" in bloom)
+    rate = false_positives / 50000
+    print(f"   False positive rate: {rate:.4f}")
+    if rate > 0.01:
+        print("❌ False positive rate far above configured error rate")
+        return False
+    print("✅ False positive rate within bounds")
+    return True
+
+def test_flexible_prefilter():
+    """The dedup prefilter must never hide a flexible match"""
+    print("\n=== Testing DeduplicationManager flexible prefilter ===")
+
+    config = {
+        'target_paths': {'pictures': 'Pictures', 'videos': 'Videos', 'wudan': 'Videos/Wudan'},
+        'options': {'enable_deduplication': True, 'force_recopy_if_newer': False}
+    }
+    dedup_manager = DeduplicationManager(config, logging.getLogger('test_bloom_filter'))
+
+    cached_names = [
+        ('20250412_292993_1_KungFu_GimStyle.mp4', 5000),
+        ('20250412_110016_1.jpg', 1000),
+        ('holiday_beach_sunset.jpg', 2000),
+    ]
+    for name, size in cached_names:
+        dedup_manager.existing_files_cache.setdefault(f"{name}|{size}", []).append(
+            CachedFile(f"Videos/2025_04_12/{name}", 0.0, "Videos/2025_04_12", "2025_04_12", "2025_04_12", size)
+        )
+    dedup_manager._build_flexible_bloom()
+
+    test_cases = [
+        ('20250412_292993_1.mp4', 5000, True),   # Appended text in target
+        ('20250412_110016_1.jpg', 1000, True),   # Exact stem
+        ('holiday.jpg', 2000, True),             # Non-date prefix at underscore boundary
+        ('20250412_292993_1.mp4', 4999, False),  # Size mismatch
+        ('20250101_000000_1.mp4', 5000, False),  # Unrelated file
+    ]
+
+    all_passed = True
+    for filename, size, expected in test_cases:
+        has_match = bool(dedup_manager._find_flexible_filename_matches(filename, size))
+        may_match = dedup_manager._may_have_flexible_match(filename, size)
+        if has_match != expected or (has_match and not may_match):
+            print(f"❌ {filename} ({size}): match={has_match}, prefilter={may_match}, expected={expected}")
+            all_passed = False
+        else:
+            print(f"✅ {filename} ({size}): match={has_match}, prefilter={may_match}")
+
+    return all_passed
+
+def main():
+    """Main test function"""
+    print("=== Bloom Filter Tests ===")
+
+    results = [
+        test_bloom_filter_membership(),
+        test_flexible_prefilter(),
+    ]
+
+    if all(results):
+        print("\n🎉 All Bloom filter tests passed!")
+        return 0
+    print("\n❌ Some Bloom filter tests failed")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,36 @@ from modules.config_manager import ConfigManager
 from modules.logger_setup import setup_logging
 from modules.processing_state_manager import ProcessingStateManager
 
+def read_processed_files(processed_file):
+    """
+    Read tracked file ids from the processed files database
+    
+    Covers the binary snapshot (.bin, 16-byte digests), the append-only log (.jsonl)
+    and an older JSON database (.json) not yet compacted into the snapshot
+    
+    Returns:
+        (list of file ids, last updated time) or (None, None) if no database exists
+    """
+    snapshot_file = processed_file.with_suffix('.bin')
+    log_file = processed_file.with_suffix('.jsonl')
+    existing = [p for p in (snapshot_file, processed_file, log_file) if p.exists()]
+    if not existing:
+        return None, None
+    
+    processed_files = []
+    if snapshot_file.exists():
+        data = snapshot_file.read_bytes()
+        processed_files.extend(data[i:i + 16].hex() for i in range(0, len(data) - len(data) % 16, 16))
+    if processed_file.exists():
+        with open(processed_file, 'r', encoding='utf-8') as f:
+            processed_files.extend(json.load(f).get('processed_files', []))
+    if log_file.exists():
+        with open(log_file, 'r', encoding='utf-8') as f:
+            processed_files.extend(json.loads(line) for line in f if line.strip())
+    
+    last_updated = datetime.fromtimestamp(max(p.stat().st_mtime for p in existing)).isoformat()
+    return processed_files, last_updated
+
 def show_state():
     """Display current processing state"""
     print("📊 Current Processing State")
@@ -56,9 +86,10 @@ def show_state():
             size = state_file.stat().st_size
             print(f"   📄 processing_state.json ({size} bytes)")
         
-        if processed_file.exists():
-            size = processed_file.stat().st_size
-            print(f"   📄 processed_files.json ({size} bytes)")
+        for db_file in (processed_file.with_suffix('.bin'), processed_file, processed_file.with_suffix('.jsonl')):
+            if db_file.exists():
+                size = db_file.stat().st_size
+                print(f"   📄 {db_file.name} ({size} bytes)")
     else:
         print("\n📂 No state directory found")
 
@@ -90,17 +121,13 @@ def show_processed_files(limit=10):
     state_dir = Path("VideoProcessor/state")
     processed_file = state_dir / "processed_files.json"
     
-    if not processed_file.exists():
-        print("❌ No processed files database found")
-        return
-    
     try:
-        with open(processed_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        processed_files, last_updated = read_processed_files(processed_file)
+        if processed_files is None:
+            print("❌ No processed files database found")
+            return
         
-        processed_files = data.get('processed_files', [])
-        total_count = data.get('total_count', len(processed_files))
-        last_updated = data.get('last_updated', 'Unknown')
+        total_count = len(processed_files)
         
         print(f"📊 Total tracked files: {total_count}")
         print(f"🕒 Last updated: {last_updated}")
@@ -116,7 +143,8 @@ def show_processed_files(limit=10):
                 filename = Path(path).name
                 print(f"   {i:2d}. {filename} ({size} bytes, {date[:19]})")
             else:
-                print(f"   {i:2d}. {file_id}")
+                # Current databases store a digest of path|size|date
+                print(f"   {i:2d}. {file_id} (file id digest)")
                 
     except Exception as e:
         print(f"❌ Error reading processed files: {e}")
@@ -150,23 +178,22 @@ def show_stats():
     
     # Processed files database
     processed_file = state_dir / "processed_files.json"
-    if processed_file.exists():
+    processed_files, last_updated = read_processed_files(processed_file)
+    if processed_files is not None:
         try:
-            with open(processed_file, 'r', encoding='utf-8') as f:
-                processed_data = json.load(f)
-            
-            processed_files = processed_data.get('processed_files', [])
-            
             print(f"\n📋 Processed Files Database:")
             print(f"   📊 Total files: {len(processed_files)}")
-            print(f"   🕒 Last updated: {processed_data.get('last_updated', 'N/A')}")
-            
-            # Analyze file types
-            video_count = sum(1 for f in processed_files if '.mp4' in f.lower() or '.avi' in f.lower() or '.mov' in f.lower())
-            photo_count = len(processed_files) - video_count
+            print(f"   🕒 Last updated: {last_updated}")
             
-            print(f"   🎬 Videos: {video_count}")
-            print(f"   📷 Photos: {photo_count}")
+            # Analyze file types (only entries from older databases still carry the path;
+            # current ones are digests)
+            named_files = [f for f in processed_files if '|' in f]
+            if named_files:
+                video_count = sum(1 for f in named_files if '.mp4' in f.lower() or '.avi' in f.lower() or '.mov' in f.lower())
+                photo_count = len(named_files) - video_count
+                
+                print(f"   🎬 Videos: {video_count}")
+                print(f"   📷 Photos: {photo_count}")
             
         except Exception as e:
             print(f"❌ Error reading processed files: {e}")
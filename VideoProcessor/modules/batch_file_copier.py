@@ -4,6 +4,8 @@ import subprocess
 from typing import List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
+from .config_manager import get_max_workers
+
 
 class BatchFileCopier:
     """High-performance batch file copier using system commands and progress tracking"""
@@ -17,6 +19,9 @@ class BatchFileCopier:
         self.failed_files = 0
         self.copied_files = 0
         
+        # Copies run on FileOrganizer's worker pool; 1 keeps the original one-file-at-a-time path
+        self.max_workers = get_max_workers(config)
+        
     def copy_files_batch(self, files_to_process: List[Dict[str, Any]], 
                         target_path_resolver, file_organizer, 
                         processing_state_manager) -> Dict[str, Any]:
@@ -47,10 +52,7 @@ class BatchFileCopier:
         )
         
         # Process each target directory in batches
-        for target_dir, file_list in files_by_target_dir.items():
-            self._process_directory_batch(
-                target_dir, file_list, file_organizer, processing_state_manager
-            )
+        self._process_all_directories(files_by_target_dir, file_organizer, processing_state_manager)
         
         # Final statistics
         elapsed_time = time.time() - self.start_time
@@ -100,8 +102,7 @@ class BatchFileCopier:
         self.logger.info(f"Grouped files into {len(files_by_dir)} target directories")
 
         # Process each directory
-        for target_dir, files in files_by_dir.items():
-            self._process_directory_batch(target_dir, files, file_organizer, processing_state_manager)
+        self._process_all_directories(files_by_dir, file_organizer, processing_state_manager)
 
         return self._get_final_stats()
 
@@ -163,6 +164,62 @@ class BatchFileCopier:
         self.logger.info(f"Grouped files into {len(files_by_dir)} target directories")
         return files_by_dir
     
+    def _process_all_directories(self, files_by_dir: Dict[str, List[Dict[str, Any]]],
+                                 file_organizer, processing_state_manager):
+        """
+        Process the files of every target directory
+        With more than one worker the files go through FileOrganizer.organize_files_batch,
+        which plans each file on this thread and runs only the copies on its worker pool
+        """
+        if self.max_workers == 1:
+            for target_dir, file_list in files_by_dir.items():
+                self._process_directory_batch(target_dir, file_list, file_organizer, processing_state_manager)
+            return
+        
+        def file_done(file_info: Dict[str, Any], success: bool, target_path: str):
+            self._finish_single_file(file_info, success, processing_state_manager)
+            
+            # Update progress every 10 files or at the end
+            if self.processed_files % 10 == 0 or self.processed_files == self.total_files:
+                self._log_progress()
+        
+        file_organizer.organize_files_batch(
+            self._iter_directory_files(files_by_dir), skip_dedup_check=True, file_callback=file_done
+        )
+    
+    def _iter_directory_files(self, files_by_dir: Dict[str, List[Dict[str, Any]]]):
+        """Yield the files of each target directory in turn, creating the directory first"""
+        for target_dir, file_list in files_by_dir.items():
+            # Ensure target directory exists
+            os.makedirs(target_dir, exist_ok=True)
+            
+            self.logger.info(f"Processing {len(file_list)} files for directory: {target_dir}")
+            
+            for file_info in file_list:
+                if not isinstance(file_info, dict):
+                    self.logger.error(f"ERROR: file_info is not a dictionary: {type(file_info)} - {file_info}")
+                    self.failed_files += 1
+                    self.processed_files += 1
+                    continue
+                yield file_info
+    
+    def _finish_single_file(self, file_info: Dict[str, Any], success: bool, processing_state_manager):
+        """Count a file's outcome and mark successful copies as processed"""
+        filename = file_info.get('name', file_info.get('filename'))
+        try:
+            if success:
+                processing_state_manager.mark_file_processed(file_info)
+                self.copied_files += 1
+                self.logger.debug("Successfully copied: %s", filename)
+            else:
+                self.failed_files += 1
+                self.logger.error("Failed to copy: %s", filename)
+        except Exception as e:
+            self.failed_files += 1
+            self.logger.error(f"Error processing file {filename}: {e}")
+        finally:
+            self.processed_files += 1
+    
     def _process_directory_batch(self, target_dir: str, file_list: List[Dict[str, Any]], 
                                file_organizer, processing_state_manager):
         """Process all files for a specific target directory in batch"""
@@ -215,10 +272,10 @@ class BatchFileCopier:
 
                 processing_state_manager.mark_file_processed(file_info)
                 self.copied_files += 1
-                self.logger.debug(f"Successfully copied: {filename}")
+                self.logger.debug("Successfully copied: %s", filename)
             else:
                 self.failed_files += 1
-                self.logger.error(f"Failed to copy: {filename}")
+                self.logger.error("Failed to copy: %s", filename)
                 
         except Exception as e:
             self.failed_files += 1
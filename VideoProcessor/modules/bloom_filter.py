@@ -0,0 +1,56 @@
+"""
+Bloom Filter for PhoneSync + VideoProcessor
+Compact probabilistic set used to reject definite negatives before expensive lookups
+"""
+
+import hashlib
+import math
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys
+    A negative answer is definite; a positive answer must be confirmed by the caller
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize Bloom filter sized for the expected number of keys
+
+        Args:
+            capacity: Expected number of keys to be added
+            error_rate: Target false positive rate at capacity
+        """
+        capacity = max(int(capacity), 1)
+
+        # Standard sizing: m = -n*ln(p) / ln(2)^2 bits, k = (m/n)*ln(2) hashes
+        num_bits = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        """Yield bit positions for a key using double hashing of one blake2b digest"""
+        digest = hashlib.blake2b(key.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        num_bits = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    def add(self, key: str):
+        """Add a key to the filter"""
+        bits = self.bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self.count
@@ -3,12 +3,23 @@ Configuration Manager for PhoneSync + VideoProcessor
 Handles loading and validation of YAML configuration
 """
 
-import yaml
 import os
 from pathlib import Path
 from typing import Dict, Any
 import logging
 
+def get_max_workers(config: Dict[str, Any]) -> int:
+    """
+    Get the worker count for parallel file operations (performance.max_concurrent_operations)
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Number of workers, at least 1
+    """
+    return max(1, int(config.get('performance', {}).get('max_concurrent_operations', 4)))
+
 class ConfigManager:
     """Manages configuration loading and validation"""
     
@@ -32,6 +43,9 @@ class ConfigManager:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
+        # Imported here so modules that only use get_max_workers don't need PyYAML
+        import yaml
+        
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 self.config = yaml.safe_load(f)
@@ -5,13 +5,33 @@ Converted from PowerShell Build-ExistingFilesCache and Test-FileExistsInTarget f
 """
 
 import os
+import sys
 import logging
 import hashlib
+import json
+import time
 from pathlib import Path
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 import re
 
+from .bloom_filter import BloomFilter
+from .processing_state_manager import resolve_state_dir
+
+# Format version of the persisted target listing; a file with another version is ignored
+_DIRECTORY_INDEX_VERSION = 3
+
+@dataclass(slots=True)
+class CachedFile:
+    """Existing target file entry held in the deduplication cache"""
+    path: str
+    last_write_time: float  # Epoch seconds (st_mtime)
+    directory: str
+    date_pattern: Optional[str]
+    full_directory_name: str
+    size: int
+
 class DeduplicationManager:
     """
     Manages file deduplication using name+size caching with flexible date folder matching
@@ -22,7 +42,8 @@ class DeduplicationManager:
         """Initialize deduplication manager"""
         self.config = config
         self.logger = logger
-        self.existing_files_cache = {}  # Key: "filename|size", Value: list of file info
+        self.existing_files_cache: Dict[str, List[CachedFile]] = {}  # Key: "filename|size"
+        self._flexible_bloom: Optional[BloomFilter] = None  # Prefilter for flexible filename matching
         
         # Get target paths from config
         self.target_paths = [
@@ -30,66 +51,242 @@ class DeduplicationManager:
             config['target_paths']['videos'],
             config['target_paths']['wudan']
         ]
+
+        # Per-directory listing of the targets saved by build_cache (state_management.dedup_cache_file).
+        # A folder whose mtime is unchanged since then is reused without listing or stat-ing its files.
+        # Files rewritten in place do not change the folder mtime, so the whole listing is dropped
+        # once it is older than dedup_cache_max_age_hours
+        state_config = config.get('state_management', {})
+        cache_file_name = state_config.get('dedup_cache_file')
+        self.cache_file = resolve_state_dir(config) / cache_file_name if cache_file_name else None
+        self.cache_max_age = float(state_config.get('dedup_cache_max_age_hours', 24)) * 3600
     
     def build_cache(self) -> int:
         """
         Build cache of existing files in target directories
         Converted from PowerShell Build-ExistingFilesCache function
+        Folders unchanged since the last build reuse the saved listing (see _list_directory)
         
         Returns:
             Number of files cached
         """
-        self.logger.info("Building cache of existing files in target directories...")
+        log = self.logger
+        log.info("Building cache of existing files in target directories...")
         
         self.existing_files_cache = {}
         total_files = 0
         
+        # root -> [directory mtime_ns, reusable, subdirectory names, [(filename, size, mtime), ...]]
+        previous_index = self._load_directory_index()
+        directory_index = {}
+        
         for target_path in self.target_paths:
             if not os.path.exists(target_path):
-                self.logger.info(f"Target path does not exist, will be created: {target_path}")
+                log.info(f"Target path does not exist, will be created: {target_path}")
                 continue
             
-            self.logger.info(f"Scanning existing files in: {target_path}")
+            log.info(f"Scanning existing files in: {target_path}")
             
             try:
-                # Recursively scan target directory
-                for root, dirs, files in os.walk(target_path):
-                    for filename in files:
-                        file_path = os.path.join(root, filename)
+                # Recursively scan target directory (same order as os.walk)
+                pending_dirs = [target_path]
+                while pending_dirs:
+                    root = pending_dirs.pop()
+                    listing = self._list_directory(root, previous_index)
+                    if listing is None:
+                        continue
+                    directory_index[root] = listing
+                    _, _, subdirs, files = listing
+                    pending_dirs.extend(os.path.join(root, name) for name in reversed(subdirs))
+                    if not files:
+                        continue
+
+                    # Directory-level values are computed once and shared by every file in it
+                    root = sys.intern(root)
+                    directory_name = sys.intern(os.path.basename(root))
+                    date_pattern = self._extract_date_pattern(directory_name)
+                    if date_pattern:
+                        date_pattern = sys.intern(date_pattern)
+
+                    for filename, file_size, last_write_time in files:
+                        file_key = f"{filename}|{file_size}"
                         
-                        try:
-                            file_stat = os.stat(file_path)
-                            file_key = f"{filename}|{file_stat.st_size}"
-                            
-                            # Initialize list if key doesn't exist
-                            if file_key not in self.existing_files_cache:
-                                self.existing_files_cache[file_key] = []
-                            
-                            # Extract date pattern from directory name for flexible matching
-                            directory_name = os.path.basename(root)
-                            date_pattern = self._extract_date_pattern(directory_name)
-                            
-                            file_info = {
-                                'path': file_path,
-                                'last_write_time': datetime.fromtimestamp(file_stat.st_mtime),
-                                'directory': root,
-                                'date_pattern': date_pattern,
-                                'full_directory_name': directory_name,
-                                'size': file_stat.st_size
-                            }
-                            
-                            self.existing_files_cache[file_key].append(file_info)
-                            total_files += 1
-                            
-                        except (OSError, IOError) as e:
-                            self.logger.warning(f"Error processing file {file_path}: {e}")
-                            continue
+                        # Initialize list if key doesn't exist
+                        if file_key not in self.existing_files_cache:
+                            self.existing_files_cache[file_key] = []
+                        
+                        file_info = CachedFile(
+                            path=os.path.join(root, filename),
+                            last_write_time=last_write_time,  # Raw epoch float, compared lazily
+                            directory=root,
+                            date_pattern=date_pattern,
+                            full_directory_name=directory_name,
+                            size=file_size
+                        )
+                        
+                        self.existing_files_cache[file_key].append(file_info)
+                        total_files += 1
                             
             except Exception as e:
-                self.logger.warning(f"Error scanning {target_path}: {e}")
+                log.warning(f"Error scanning {target_path}: {e}")
+        
+        if self.cache_file is not None:
+            self._save_directory_index(directory_index)
         
-        self.logger.info(f"Cache built successfully. Found {total_files} existing files across all target directories.")
+        self._build_flexible_bloom()
+
+        log.info(f"Cache built successfully. Found {total_files} existing files across all target directories.")
         return total_files
+
+    def _list_directory(self, root: str, previous_index: Dict[str, list]) -> Optional[list]:
+        """
+        List one target directory, reusing the saved listing if the directory is unchanged
+        Adding, removing or renaming an entry updates the directory mtime; a file
+        rewritten in place does not, which the index max age bounds
+        
+        Args:
+            root: Directory to list
+            previous_index: Listings saved by the last build_cache
+            
+        Returns:
+            [mtime_ns, reusable, subdirectory names, [(filename, size, mtime), ...]] or None if unreadable
+        """
+        try:
+            directory_mtime = os.stat(root).st_mtime_ns
+        except OSError:
+            return None
+        
+        previous = previous_index.get(root)
+        if previous is not None and previous[1] and previous[0] == directory_mtime:
+            return previous
+        
+        subdirs = []
+        files = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk, symlinked folders are not descended into
+                        if not entry.is_symlink():
+                            subdirs.append(entry.name)
+                        continue
+                    try:
+                        file_stat = entry.stat()
+                    except OSError as e:
+                        self.logger.warning(f"Error processing file {entry.path}: {e}")
+                        continue
+                    files.append((entry.name, file_stat.st_size, file_stat.st_mtime))
+        except OSError:
+            return None
+        
+        # A folder changed while it was being listed may be missing entries, so its listing is
+        # not reused. Both mtimes come from the file system itself, so a share whose clock
+        # differs from ours does not matter
+        try:
+            reusable = os.stat(root).st_mtime_ns == directory_mtime
+        except OSError:
+            reusable = False
+        
+        return [directory_mtime, reusable, subdirs, files]
+
+    def _load_directory_index(self) -> Dict[str, list]:
+        """
+        Load the target listing saved by the last build_cache
+        
+        Returns:
+            Directory listings keyed by path (empty if there is none or it is unreadable)
+        """
+        if self.cache_file is None:
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable deduplication cache {self.cache_file}: {e}")
+            return {}
+        
+        if data.get('version') != _DIRECTORY_INDEX_VERSION:
+            return {}
+        
+        # An old listing may hold files rewritten in place since; rescan everything
+        age = time.time() - data.get('saved_at', 0)
+        if not 0 <= age <= self.cache_max_age:
+            self.logger.info(f"Deduplication cache is older than {self.cache_max_age / 3600:g}h, rescanning all target folders")
+            return {}
+        return data.get('directories', {})
+
+    def _save_directory_index(self, directory_index: Dict[str, list]):
+        """
+        Save the target listing for the next build_cache (written atomically)
+        
+        Args:
+            directory_index: Directory listings keyed by path
+        """
+        temp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': _DIRECTORY_INDEX_VERSION, 'saved_at': time.time(),
+                           'directories': directory_index},
+                          f, separators=(',', ':'))
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            self.logger.warning(f"Could not save deduplication cache {self.cache_file}: {e}")
+
+    def invalidate_persisted_cache(self):
+        """Delete the saved target listing so the next build_cache rescans every folder"""
+        if self.cache_file is None:
+            return
+        try:
+            os.remove(self.cache_file)
+            self.logger.info(f"Deleted deduplication cache: {self.cache_file}")
+        except FileNotFoundError:
+            pass
+
+    def _build_flexible_bloom(self):
+        """
+        Build the Bloom filter used to skip the flexible filename scan for definite misses
+        Holds every underscore-delimited stem prefix (and the full stem) of each cached file with its size
+        """
+        key_count = 0
+        for file_key in self.existing_files_cache:
+            key_count += file_key.count('_') + 1
+
+        self._flexible_bloom = BloomFilter(capacity=max(key_count, 1024), error_rate=0.001)
+        for file_key in self.existing_files_cache:
+            cached_filename, cached_size = file_key.rsplit('|', 1)
+            self._add_flexible_bloom_keys(cached_filename, cached_size)
+
+    def _add_flexible_bloom_keys(self, filename: str, file_size):
+        """Add the stem prefixes of a cached filename that a flexible match could key on"""
+        stem = Path(filename).stem
+        bloom = self._flexible_bloom
+        index = stem.find('_')
+        while index != -1:
+            bloom.add(f"{stem[:index]}|{file_size}")
+            index = stem.find('_', index + 1)
+        bloom.add(f"{stem}|{file_size}")
+
+    def _may_have_flexible_match(self, filename: str, file_size: int) -> bool:
+        """
+        Test the Bloom prefilter for a possible flexible match
+
+        Returns:
+            False if no cached file can flexibly match, True if the full scan is needed
+        """
+        if self._flexible_bloom is None:
+            return True
+
+        base_pattern = self._extract_base_filename_pattern(filename)
+        if base_pattern and f"{base_pattern}|{file_size}" in self._flexible_bloom:
+            return True
+        return f"{Path(filename).stem}|{file_size}" in self._flexible_bloom
     
     def _extract_date_pattern(self, directory_name: str) -> Optional[str]:
         """
@@ -128,53 +325,83 @@ class DeduplicationManager:
         if not self.config['options']['enable_deduplication']:
             return False
 
-        # First try exact filename match
+        # Extract expected date pattern from target directory
+        target_directory_name = os.path.basename(target_directory)
+        expected_date_pattern = self._extract_date_pattern(target_directory_name)
+
+        # First try exact filename match - the common case skips the full-cache flexible scan
         file_key = f"{filename}|{file_size}"
-        exact_matches = self.existing_files_cache.get(file_key, [])
+        exact_matches = self.existing_files_cache.get(file_key)
+        if exact_matches:
+            result = self._check_existing_matches(exact_matches, filename, file_size, file_date,
+                                                  target_directory, expected_date_pattern, quiet)
+            if result is not None:
+                return result
+
+        # Bloom prefilter: most new files have no flexible candidate, so skip the full-cache scan
+        if not self._may_have_flexible_match(filename, file_size):
+            return False
 
         # Then try flexible filename matching (base filename + size validation)
         flexible_matches = self._find_flexible_filename_matches(filename, file_size)
+        if flexible_matches:
+            result = self._check_existing_matches(flexible_matches, filename, file_size, file_date,
+                                                  target_directory, expected_date_pattern, quiet)
+            if result is not None:
+                return result
 
-        # Combine both types of matches
-        all_matches = exact_matches + flexible_matches
+        return False
 
-        if not all_matches:
-            return False
+    def _check_existing_matches(self, matches: List[CachedFile], filename: str, file_size: int,
+                                file_date: datetime, target_directory: str,
+                                expected_date_pattern: Optional[str], quiet: bool) -> Optional[bool]:
+        """
+        Check candidate cache entries against the target folder
 
-        # Extract expected date pattern from target directory
-        target_directory_name = os.path.basename(target_directory)
-        expected_date_pattern = self._extract_date_pattern(target_directory_name)
+        Args:
+            matches: Candidate cache entries for the source file
+            filename: Name of the source file
+            file_size: Size of the file in bytes
+            file_date: Date/time of the file
+            target_directory: Target directory path
+            expected_date_pattern: Date pattern of the target directory (YYYY_MM_DD) or None
+            quiet: If True, suppress info logging
 
-        for existing_file in all_matches:
+        Returns:
+            True if a matching file exists, False if it exists but the source is newer,
+            None if no candidate is in a matching folder
+        """
+        for existing_file in matches:
             match_found = False
 
             # Check if file is in directory with same date pattern (flexible matching)
-            if expected_date_pattern and existing_file['date_pattern']:
-                if existing_file['date_pattern'] == expected_date_pattern:
+            if expected_date_pattern and existing_file.date_pattern:
+                if existing_file.date_pattern == expected_date_pattern:
                     match_found = True
                     if not quiet:
-                        existing_filename = os.path.basename(existing_file['path'])
-                        self.logger.info(f"Found existing file in date-matched folder: {filename} "
-                                       f"matches {existing_filename} in {existing_file['full_directory_name']}")
-            elif existing_file['directory'] == target_directory:
+                        existing_filename = os.path.basename(existing_file.path)
+                        self.logger.info("Found existing file in date-matched folder: %s matches %s in %s",
+                                         filename, existing_filename, existing_file.full_directory_name)
+            elif existing_file.directory == target_directory:
                 # Exact directory match (fallback)
                 match_found = True
 
             if match_found:
                 # Check if forceRecopyIfNewer is enabled
                 if self.config['options']['force_recopy_if_newer']:
-                    if file_date > existing_file['last_write_time']:
+                    # last_write_time is stored as an epoch float to avoid a datetime per cached file
+                    if file_date.timestamp() > existing_file.last_write_time:
                         if not quiet:
-                            self.logger.info(f"File exists but source is newer: {filename}")
+                            self.logger.info("File exists but source is newer: %s", filename)
                         return False  # File exists but source is newer, so copy it
 
                 if not quiet:
-                    self.logger.info(f"File already exists in target: {filename} (Size: {file_size} bytes)")
+                    self.logger.info("File already exists in target: %s (Size: %s bytes)", filename, file_size)
                 return True
 
-        return False
+        return None
 
-    def _find_flexible_filename_matches(self, source_filename: str, file_size: int) -> List[Dict[str, Any]]:
+    def _find_flexible_filename_matches(self, source_filename: str, file_size: int) -> List[CachedFile]:
         """
         Find files that match the base filename pattern with potential appended text
 
@@ -185,9 +412,10 @@ class DeduplicationManager:
             file_size: Expected file size for validation
 
         Returns:
-            List of matching file info dictionaries
+            List of matching cache entries
         """
         matches = []
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # Extract base filename (up to second underscore for date-named files)
         base_pattern = self._extract_base_filename_pattern(source_filename)
@@ -206,7 +434,9 @@ class DeduplicationManager:
             # Check if cached filename matches the base pattern
             if self._filenames_match_flexible(source_filename, cached_filename, base_pattern):
                 matches.extend(file_list)
-                self.logger.debug(f"Flexible match found: {source_filename} matches {cached_filename} (size: {file_size})")
+                if log_debug:
+                    self.logger.debug("Flexible match found: %s matches %s (size: %s)",
+                                      source_filename, cached_filename, file_size)
 
         return matches
 
@@ -327,18 +557,16 @@ class DeduplicationManager:
                     f.seek(-1024, 2)
                     last_bytes = f.read(1024)
                     
-                    # Combine with file size
-                    combined_data = first_bytes + last_bytes + str(file_size).encode('utf-8')
-                    
+                    # Feed each part separately (same digest as hashing the concatenation)
                     hash_obj = hashlib.sha256()
-                    hash_obj.update(combined_data)
+                    hash_obj.update(first_bytes)
+                    hash_obj.update(last_bytes)
+                    hash_obj.update(str(file_size).encode('utf-8'))
                     return hash_obj.hexdigest()
             else:
-                # For small files, hash the entire file
-                hash_obj = hashlib.sha256()
+                # For small files, hash the entire file via the C-level digest loop
                 with open(file_path, 'rb') as f:
-                    hash_obj.update(f.read())
-                return hash_obj.hexdigest()
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
                 
         except Exception as e:
             self.logger.warning(f"Error computing hash for {file_path}: {e}")
@@ -364,16 +592,19 @@ class DeduplicationManager:
         directory_name = os.path.basename(directory)
         date_pattern = self._extract_date_pattern(directory_name)
         
-        file_info = {
-            'path': target_path,
-            'last_write_time': file_date,
-            'directory': directory,
-            'date_pattern': date_pattern,
-            'full_directory_name': directory_name,
-            'size': file_size
-        }
+        file_info = CachedFile(
+            path=target_path,
+            last_write_time=file_date.timestamp(),
+            directory=directory,
+            date_pattern=date_pattern,
+            full_directory_name=directory_name,
+            size=file_size
+        )
         
         self.existing_files_cache[file_key].append(file_info)
+
+        if self._flexible_bloom is not None:
+            self._add_flexible_bloom_keys(filename, file_size)
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get statistics about the deduplication cache"""
@@ -388,7 +619,7 @@ class DeduplicationManager:
         for file_list in self.existing_files_cache.values():
             for file_info in file_list:
                 for target_path in self.target_paths:
-                    if file_info['directory'].startswith(target_path):
+                    if file_info.directory.startswith(target_path):
                         path_counts[target_path] += 1
                         break
         
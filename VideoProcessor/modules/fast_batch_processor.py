@@ -8,10 +8,49 @@ import os
 import logging
 import re
 from typing import Dict, List, Set, Tuple, Any, Optional
-from pathlib import Path
 from datetime import datetime
 import time
 
+# Supported media extensions for inventory scanning (frozenset for O(1) membership)
+_ALLOWED_EXTS = frozenset({'.jpg', '.jpeg', '.mp4', '.mov', '.avi'})
+_PICTURE_EXTS = frozenset({'.jpg', '.jpeg'})
+
+def _iter_supported_files(folder_path: str):
+    """
+    Walk a folder tree with os.scandir, yielding each supported file
+    Same order as os.walk (each directory's files, then its subdirectories depth-first);
+    unreadable directories are skipped like os.walk does. DirEntry caches its stat, and
+    on Windows the size and mtime come with the directory listing, without a stat call
+
+    Args:
+        folder_path: Root folder to walk
+
+    Yields:
+        (os.DirEntry, lowercased extension) for every file with an extension in _ALLOWED_EXTS
+    """
+    splitext = os.path.splitext
+    pending_dirs = [folder_path]
+    while pending_dirs:
+        subdirs = []
+        try:
+            with os.scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # os.walk lists symlinked folders but does not descend into them
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        ext = splitext(entry.name)[1].lower()
+                        if ext in _ALLOWED_EXTS:
+                            yield entry, ext
+        except OSError:
+            continue
+        pending_dirs.extend(reversed(subdirs))
+
 class FastBatchProcessor:
     """
     High-performance batch file processor using set operations instead of loops
@@ -38,58 +77,64 @@ class FastBatchProcessor:
             # WeChat patterns: wx_camera_timestamp.ext
             r'wx_camera_(\d{10,13})',  # Unix timestamp (10-13 digits)
         ]
+
+        # Supported files seen by the last build_source_inventory, in walk order:
+        # (file_key, file_path, extension, mtime, source folder name). Lets
+        # convert_keys_to_file_info skip re-walking and re-stating the source folders
+        self._inventory_folders = None
+        self._inventory_entries = []
         
     def build_source_inventory(self, source_folders: List[str]) -> Set[str]:
         """
         Build a flat set of source files using format: filename|size
         This is much faster than individual file processing
         """
+        log = self.logger
         source_files = set()
         total_files = 0
 
-        self.logger.info("Building source file inventory...")
+        log.info("Building source file inventory...")
         start_time = time.time()
 
+        inventory_entries = []
         for folder_path in source_folders:
             # Use path as-is since ConfigManager now preserves proper UNC syntax
             if not os.path.exists(folder_path):
-                self.logger.warning(f"Source folder not found: {folder_path}")
+                log.warning(f"Source folder not found: {folder_path}")
                 continue
                 
-            self.logger.info(f"Scanning source: {folder_path}")
+            log.info(f"Scanning source: {folder_path}")
             folder_files = 0
+            source_folder_name = os.path.basename(folder_path)
             
             try:
-                # Use os.walk for efficient directory traversal
-                for root, dirs, files in os.walk(folder_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
+                for entry, ext in _iter_supported_files(folder_path):
+                    try:
+                        # One (cached) stat gives the size now and the mtime for convert_keys_to_file_info
+                        file_stat = entry.stat()
                         
-                        # Filter by supported extensions
-                        ext = Path(file).suffix.lower()
-                        if ext not in ['.jpg', '.jpeg', '.mp4', '.mov', '.avi']:
-                            continue
-                            
-                        try:
-                            # Get file size efficiently
-                            file_size = os.path.getsize(file_path)
-                            
-                            # Create unique key: filename|size
-                            file_key = f"{file}|{file_size}"
-                            source_files.add(file_key)
-                            folder_files += 1
-                            total_files += 1
-                            
-                        except (OSError, PermissionError) as e:
-                            self.logger.warning(f"Cannot access {file_path}: {e}")
+                        # Create unique key: filename|size
+                        file_key = f"{entry.name}|{file_stat.st_size}"
+                        source_files.add(file_key)
+                        inventory_entries.append(
+                            (file_key, entry.path, ext, file_stat.st_mtime, source_folder_name)
+                        )
+                        folder_files += 1
+                        total_files += 1
+                        
+                    except (OSError, PermissionError) as e:
+                        log.warning(f"Cannot access {entry.path}: {e}")
                             
             except Exception as e:
-                self.logger.error(f"Error scanning {folder_path}: {e}")
+                log.error(f"Error scanning {folder_path}: {e}")
                 
-            self.logger.info(f"Found {folder_files} files in {os.path.basename(folder_path)}")
+            log.info(f"Found {folder_files} files in {os.path.basename(folder_path)}")
+        
+        self._inventory_folders = list(source_folders)
+        self._inventory_entries = inventory_entries
         
         elapsed = time.time() - start_time
-        self.logger.info(f"Source inventory complete: {total_files} files in {elapsed:.2f} seconds")
+        log.info(f"Source inventory complete: {total_files} files in {elapsed:.2f} seconds")
         return source_files
     
     def build_target_inventory(self, target_paths: Dict[str, str]) -> Set[str]:
@@ -97,52 +142,68 @@ class FastBatchProcessor:
         Build a flat set of target files using format: filename|size
         This replaces the slow deduplication cache building
         """
+        log = self.logger
         target_files = set()
         total_files = 0
         
-        self.logger.info("Building target file inventory...")
+        log.info("Building target file inventory...")
         start_time = time.time()
         
         for path_type, base_path in target_paths.items():
             if not base_path or not os.path.exists(base_path):
                 continue
                 
-            self.logger.info(f"Scanning target: {base_path}")
+            log.info(f"Scanning target: {base_path}")
             path_files = 0
             
             try:
-                # Use os.walk for efficient directory traversal
-                for root, dirs, files in os.walk(base_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
+                for entry, _ in _iter_supported_files(base_path):
+                    try:
+                        # Create unique key: filename|size
+                        file_key = f"{entry.name}|{entry.stat().st_size}"
+                        target_files.add(file_key)
+                        path_files += 1
+                        total_files += 1
                         
-                        # Filter by supported extensions
-                        ext = Path(file).suffix.lower()
-                        if ext not in ['.jpg', '.jpeg', '.mp4', '.mov', '.avi']:
-                            continue
-                            
-                        try:
-                            # Get file size efficiently
-                            file_size = os.path.getsize(file_path)
-                            
-                            # Create unique key: filename|size
-                            file_key = f"{file}|{file_size}"
-                            target_files.add(file_key)
-                            path_files += 1
-                            total_files += 1
-                            
-                        except (OSError, PermissionError) as e:
-                            self.logger.warning(f"Cannot access {file_path}: {e}")
+                    except (OSError, PermissionError) as e:
+                        log.warning(f"Cannot access {entry.path}: {e}")
                             
             except Exception as e:
-                self.logger.error(f"Error scanning {base_path}: {e}")
+                log.error(f"Error scanning {base_path}: {e}")
                 
-            self.logger.info(f"Found {path_files} files in {path_type}")
+            log.info(f"Found {path_files} files in {path_type}")
         
         elapsed = time.time() - start_time
-        self.logger.info(f"Target inventory complete: {total_files} files in {elapsed:.2f} seconds")
+        log.info(f"Target inventory complete: {total_files} files in {elapsed:.2f} seconds")
         return target_files
     
+    def build_target_indices(self, dedup_manager) -> Set[str]:
+        """
+        Build the deduplication cache and the flat target set from a single walk
+        The dedup cache already indexes every target file as filename|size, so the
+        set used for set-difference is derived from its keys instead of re-walking
+        the target tree
+
+        Args:
+            dedup_manager: DeduplicationManager whose cache will be (re)built
+
+        Returns:
+            Set of supported target files using format: filename|size
+        """
+        start_time = time.time()
+
+        dedup_manager.build_cache()
+
+        target_files = set()
+        for file_key in dedup_manager.existing_files_cache:
+            filename = file_key.rsplit('|', 1)[0]
+            if os.path.splitext(filename)[1].lower() in _ALLOWED_EXTS:
+                target_files.add(file_key)
+
+        elapsed = time.time() - start_time
+        self.logger.info(f"Target indices complete: {len(target_files)} files in {elapsed:.2f} seconds")
+        return target_files
+
     def find_files_needing_processing(self, source_files: Set[str], target_files: Set[str]) -> Set[str]:
         """
         Use set difference operation to find files that need processing
@@ -171,47 +232,47 @@ class FastBatchProcessor:
         self.logger.info(f"Converting {len(file_keys)} file keys to file info...")
         start_time = time.time()
 
-        # Build a lookup map of filename|size -> full path
-        file_lookup = {}
+        # The inventory of these folders already holds every file's path, size and mtime
+        if self._inventory_folders == list(source_folders):
+            for file_key, file_path, ext, mtime, source_folder_name in self._inventory_entries:
+                if file_key in file_keys:
+                    file_info_list.append(self._build_file_info(file_key, file_path, ext, mtime, source_folder_name))
+            
+            elapsed = time.time() - start_time
+            self.logger.info(f"File info conversion complete: {len(file_info_list)} files in {elapsed:.2f} seconds")
+            return file_info_list
+
+        # Filenames still needing processing - lets unrelated files skip the stat call
+        wanted_names = {file_key.rsplit('|', 1)[0] for file_key in file_keys}
 
         for folder_path in source_folders:
             # Use path as-is since ConfigManager now preserves proper UNC syntax
             if not os.path.exists(folder_path):
                 continue
+
+            # Shared by every file_info from this folder
+            source_folder_name = os.path.basename(folder_path)
                 
             for root, dirs, files in os.walk(folder_path):
+                root_sep = os.path.join(root, '')
                 for file in files:
-                    file_path = os.path.join(root, file)
-                    ext = Path(file).suffix.lower()
+                    if file not in wanted_names:
+                        continue
+
+                    file_path = root_sep + file
+                    ext = os.path.splitext(file)[1].lower()
                     
-                    if ext not in ['.jpg', '.jpeg', '.mp4', '.mov', '.avi']:
+                    if ext not in _ALLOWED_EXTS:
                         continue
                         
                     try:
-                        file_size = os.path.getsize(file_path)
-                        file_key = f"{file}|{file_size}"
+                        file_stat = os.stat(file_path)
+                        file_key = f"{file}|{file_stat.st_size}"
                         
                         if file_key in file_keys:
-                            # Extract date from filename using FileScanner's logic
-                            file_date = self._extract_date_from_filename(file)
-                            if not file_date:
-                                # Fallback to file modification time
-                                file_date = datetime.fromtimestamp(os.path.getmtime(file_path))
-
-                            # Determine file type
-                            file_type = 'picture' if ext in ['.jpg', '.jpeg'] else 'video'
-
-                            file_info = {
-                                'name': file,
-                                'path': file_path,
-                                'size': file_size,
-                                'type': file_type,
-                                'extension': ext,
-                                'date': file_date,  # Use 'date' field like FileScanner
-                                'source_folder': os.path.basename(folder_path)
-                            }
-
-                            file_info_list.append(file_info)
+                            file_info_list.append(self._build_file_info(
+                                file_key, file_path, ext, file_stat.st_mtime, source_folder_name
+                            ))
                             
                     except (OSError, PermissionError):
                         continue
@@ -221,6 +282,30 @@ class FastBatchProcessor:
         
         return file_info_list
     
+    def _build_file_info(self, file_key: str, file_path: str, ext: str, mtime: float,
+                         source_folder_name: str) -> Dict[str, Any]:
+        """Build the file info dictionary for a source file needing processing"""
+        file_name, file_size = file_key.rsplit('|', 1)
+
+        # Extract date from filename using FileScanner's logic
+        file_date = self._extract_date_from_filename(file_name)
+        if not file_date:
+            # Fallback to file modification time
+            file_date = datetime.fromtimestamp(mtime)
+
+        # Determine file type
+        file_type = 'picture' if ext in _PICTURE_EXTS else 'video'
+
+        return {
+            'name': file_name,
+            'path': file_path,
+            'size': int(file_size),
+            'type': file_type,
+            'extension': ext,
+            'date': file_date,  # Use 'date' field like FileScanner
+            'source_folder': source_folder_name
+        }
+    
     def get_processing_statistics(self, source_files: Set[str], target_files: Set[str], files_to_process: Set[str]) -> Dict[str, Any]:
         """
         Generate processing statistics
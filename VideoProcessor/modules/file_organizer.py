@@ -5,11 +5,60 @@ Converted from PowerShell Copy-FileToTarget and Process-Directory functions
 """
 
 import os
+import stat
+import errno
 import shutil
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple, List
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, List, Iterable
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .config_manager import get_max_workers
+
+# Buffer size for the user-space copy fallback
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Errors meaning a kernel copy strategy is unsupported for this file pair (try the next one)
+_FAST_COPY_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                          errno.ENOTSOCK, errno.EBADF, errno.ETXTBSY}
+
+def _sendfile(src_fd: int, dst_fd: int, count: int) -> int:
+    """os.sendfile with copy_file_range's argument order (uses the current file offsets)"""
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+# Kernel-side copy strategies available on this platform, in order of preference
+# (neither exists on Windows, which uses the buffered loop)
+_KERNEL_COPY_FUNCS = tuple(
+    func for func in (getattr(os, 'copy_file_range', None), _sendfile if hasattr(os, 'sendfile') else None)
+    if func is not None
+)
+
+def _path_key(path: str) -> str:
+    """
+    Comparison key for a target path: two copies must not be planned to the same file,
+    which on Windows/SMB includes names that differ only in case
+    """
+    return os.path.normcase(os.path.normpath(path))
+
+# Whether timestamps/permissions can be set on an open descriptor (not on Windows)
+_METADATA_VIA_FD = os.utime in os.supports_fd and os.chmod in os.supports_fd
+
+@dataclass(slots=True)
+class OrganizerStats:
+    """Per-run FileOrganizer counters (attribute stores instead of dict lookups per file)"""
+    files_processed: int = 0
+    files_copied: int = 0
+    files_skipped: int = 0
+    files_failed: int = 0
+    bytes_copied: int = 0
+    directories_created: int = 0
+    duplicates_found: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Snapshot counters as a plain dictionary"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 class FileOrganizer:
     """
@@ -33,16 +82,18 @@ class FileOrganizer:
         self.target_resolver = target_resolver
         self.dedup_manager = dedup_manager
         
+        # fsync each copied file before it is counted as copied (slower, survives power loss)
+        self.fsync_copies = config['options'].get('fsync_copies', False)
+        
+        # Target folders already confirmed/created, so each costs one stat/mkdir per batch
+        self._ensured_folders = set()
+        
+        # (copy function, source device, target folder) combinations a kernel copy strategy
+        # failed on as unsupported; later copies go straight to the next strategy
+        self._unsupported_copies = set()
+        
         # Statistics tracking
-        self.stats = {
-            'files_processed': 0,
-            'files_copied': 0,
-            'files_skipped': 0,
-            'files_failed': 0,
-            'bytes_copied': 0,
-            'directories_created': 0,
-            'duplicates_found': 0
-        }
+        self.stats = OrganizerStats()
     
     def organize_file(self, file_info: Dict[str, Any], dry_run: bool = False, skip_dedup_check: bool = False, quiet: bool = False) -> Tuple[bool, Optional[str]]:
         """
@@ -58,61 +109,95 @@ class FileOrganizer:
             Tuple of (success, target_path)
         """
         source_path = file_info['path']
-        filename = file_info['name']
-        file_size = file_info['size']
-        file_date = file_info['date']
 
         try:
-            # Get target folder path
-            target_folder = self.target_resolver.get_target_folder_path(file_info, quiet=quiet)
-
-            if not target_folder:
-                self.logger.warning(f"Could not determine target folder for {source_path}")
-                self.stats['files_failed'] += 1
-                return False, None
-
-            # Check if file already exists using deduplication (only if not already batch-filtered)
-            if not skip_dedup_check and self.dedup_manager.file_exists_in_target(filename, file_size, file_date, target_folder):
-                self.logger.info(f"Skipping duplicate file: {filename}")
-                self.stats['files_skipped'] += 1
-                self.stats['duplicates_found'] += 1
-                return True, target_folder  # Consider this a success (file already exists)
-            
-            # Ensure target directory exists
-            if not self.target_resolver.ensure_target_directory(target_folder):
-                self.logger.error(f"Could not create target directory: {target_folder}")
-                self.stats['files_failed'] += 1
-                return False, None
-            
-            # Get target file path (handles name collisions)
-            target_file_path, final_filename = self.target_resolver.get_target_file_path(
-                file_info, target_folder
-            )
+            status, target_file_path, final_filename = self._plan_copy(file_info, skip_dedup_check, quiet)
+            if status != 'copy':
+                return status == 'duplicate', target_file_path
             
             # Perform the copy operation
             success = self._copy_file(source_path, target_file_path, file_info, dry_run)
-            
-            if success:
-                self.stats['files_copied'] += 1
-                self.stats['bytes_copied'] += file_size
-                
-                # Update deduplication cache with newly copied file
-                if not dry_run:
-                    self.dedup_manager.update_cache_with_new_file(
-                        final_filename, file_size, target_file_path, file_date
-                    )
-                
-                return True, target_file_path
-            else:
-                self.stats['files_failed'] += 1
-                return False, None
+            return self._record_copy(file_info, target_file_path, final_filename, success, dry_run)
                 
         except Exception as e:
-            self.logger.error(f"Error organizing file {source_path}: {e}")
-            self.stats['files_failed'] += 1
+            self.logger.error("Error organizing file %s: %s", source_path, e)
+            self.stats.files_failed += 1
             return False, None
         finally:
-            self.stats['files_processed'] += 1
+            self.stats.files_processed += 1
+
+    def _plan_copy(self, file_info: Dict[str, Any], skip_dedup_check: bool = False,
+                   quiet: bool = False) -> Tuple[str, Optional[str], Optional[str]]:
+        """
+        Resolve target location and deduplication for a file without copying it
+        
+        Args:
+            file_info: Dictionary containing file information
+            skip_dedup_check: If True, skip deduplication check (already done in batch filtering)
+            quiet: If True, suppress target resolution logging
+            
+        Returns:
+            Tuple of (status, target_path, final_filename) where status is
+            'copy', 'duplicate' or 'failed'
+        """
+        source_path = file_info['path']
+        filename = file_info['name']
+        file_size = file_info['size']
+
+        # Get target folder path
+        target_folder = self.target_resolver.get_target_folder_path(file_info, quiet=quiet)
+
+        if not target_folder:
+            self.logger.warning("Could not determine target folder for %s", source_path)
+            self.stats.files_failed += 1
+            return 'failed', None, None
+
+        # Check if file already exists using deduplication (only if not already batch-filtered)
+        if not skip_dedup_check and self.dedup_manager.file_exists_in_target(filename, file_size, file_info['date'], target_folder):
+            self.logger.info("Skipping duplicate file: %s", filename)
+            self.stats.files_skipped += 1
+            self.stats.duplicates_found += 1
+            return 'duplicate', target_folder, None  # Consider this a success (file already exists)
+        
+        # Ensure target directory exists (once per folder)
+        if target_folder not in self._ensured_folders:
+            if not self.target_resolver.ensure_target_directory(target_folder):
+                self.logger.error("Could not create target directory: %s", target_folder)
+                self.stats.files_failed += 1
+                return 'failed', None, None
+            self._ensured_folders.add(target_folder)
+        
+        # Get target file path (handles name collisions)
+        target_file_path, final_filename = self.target_resolver.get_target_file_path(
+            file_info, target_folder
+        )
+        return 'copy', target_file_path, final_filename
+
+    def _record_copy(self, file_info: Dict[str, Any], target_file_path: str, final_filename: str,
+                     success: bool, dry_run: bool) -> Tuple[bool, Optional[str]]:
+        """
+        Update statistics and the deduplication cache after a copy attempt
+        
+        Returns:
+            Tuple of (success, target_path)
+        """
+        if success:
+            file_size = file_info['size']
+            self.stats.files_copied += 1
+            self.stats.bytes_copied += file_size
+            
+            # Update deduplication cache with newly copied file
+            if not dry_run:
+                self.dedup_manager.update_cache_with_new_file(
+                    final_filename, file_size, target_file_path, file_info['date']
+                )
+            
+            return True, target_file_path
+        else:
+            # Re-check the folder for the next file in case it disappeared
+            self._ensured_folders.discard(os.path.dirname(target_file_path))
+            self.stats.files_failed += 1
+            return False, None
     
     def _copy_file(self, source_path: str, target_path: str, 
                   file_info: Dict[str, Any], dry_run: bool) -> bool:
@@ -130,123 +215,264 @@ class FileOrganizer:
         """
         try:
             if dry_run:
-                self.logger.info(f"[DRY RUN] Would copy: {source_path} -> {target_path}")
+                self.logger.info("[DRY RUN] Would copy: %s -> %s", source_path, target_path)
                 return True
             
             # Check if we should actually copy files (vs move)
             if not self.config['options']['copy_files']:
-                self.logger.info(f"[COPY DISABLED] Would copy: {source_path} -> {target_path}")
+                self.logger.info("[COPY DISABLED] Would copy: %s -> %s", source_path, target_path)
                 return True
             
-            # Perform the actual copy
-            shutil.copy2(source_path, target_path)  # copy2 preserves metadata
+            # Perform the actual copy (size comes from fstat on the open target, no extra stat calls)
+            target_size = self._fast_copy(source_path, target_path)
             
-            self.logger.info(f"Copied: {source_path} -> {target_path}")
+            self.logger.info("Copied: %s -> %s", source_path, target_path)
             
             # Verify the copy was successful
-            if os.path.exists(target_path):
-                target_size = os.path.getsize(target_path)
-                source_size = file_info['size']
-                
-                if target_size == source_size:
-                    return True
-                else:
-                    self.logger.error(f"Copy verification failed: size mismatch for {target_path}")
-                    # Clean up incomplete copy
-                    try:
-                        os.remove(target_path)
-                    except Exception:
-                        pass
-                    return False
+            if target_size == file_info['size']:
+                return True
             else:
-                self.logger.error(f"Copy failed: target file does not exist {target_path}")
+                self.logger.error("Copy verification failed: size mismatch for %s", target_path)
+                # Clean up incomplete copy
+                try:
+                    os.remove(target_path)
+                except Exception:
+                    pass
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Failed to copy file {source_path} to {target_path}: {e}")
+            self.logger.error("Failed to copy file %s to %s: %s", source_path, target_path, e)
             return False
+
+    def _fast_copy(self, source_path: str, target_path: str) -> int:
+        """
+        Copy file contents using the cheapest available strategy and preserve metadata
+        Tries os.copy_file_range, then os.sendfile, then a readinto loop over a 1 MiB buffer
+        
+        Args:
+            source_path: Source file path
+            target_path: Target file path
+            
+        Returns:
+            Size of the target file in bytes after the copy
+        """
+        with open(source_path, 'rb') as fsrc, open(target_path, 'wb') as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            source_stat = os.fstat(src_fd)
+            remaining = source_stat.st_size
+
+            copied = False
+            target_folder = os.path.dirname(target_path)
+            for copy_func in _KERNEL_COPY_FUNCS:
+                strategy_key = (copy_func, source_stat.st_dev, target_folder)
+                if strategy_key in self._unsupported_copies:
+                    continue
+                copied = self._kernel_copy(copy_func, src_fd, dst_fd, remaining)
+                if copied:
+                    break
+                self._unsupported_copies.add(strategy_key)
+            if not copied:
+                buffer = memoryview(bytearray(_COPY_BUFFER_SIZE))
+                while True:
+                    read = fsrc.readinto(buffer)
+                    if not read:
+                        break
+                    fdst.write(buffer[:read])
+
+            fdst.flush()
+            target_size = os.fstat(dst_fd).st_size
+
+            # Preserve timestamps and permission bits (what copy2 did) on the open descriptor,
+            # reusing the source fstat instead of re-resolving both paths
+            if _METADATA_VIA_FD:
+                os.utime(dst_fd, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+                os.chmod(dst_fd, stat.S_IMODE(source_stat.st_mode))
+
+            if self.fsync_copies:
+                os.fsync(dst_fd)
+
+        if not _METADATA_VIA_FD:
+            shutil.copystat(source_path, target_path)
+        return target_size
+
+    @staticmethod
+    def _kernel_copy(copy_func, src_fd: int, dst_fd: int, remaining: int) -> bool:
+        """
+        Run a kernel-side copy loop until the source is exhausted
+        
+        Returns:
+            True if the copy completed, False if the strategy is unsupported and nothing was written
+        """
+        offset = 0
+        while True:
+            try:
+                sent = copy_func(src_fd, dst_fd, max(remaining - offset, _COPY_BUFFER_SIZE))
+            except OSError as e:
+                if offset == 0 and e.errno in _FAST_COPY_UNSUPPORTED:
+                    return False
+                raise
+            if sent == 0:
+                # Some filesystems (FUSE, CIFS, procfs) report 0 instead of an error when the
+                # strategy is unsupported; a non-empty source must not read as fully copied
+                return not (offset == 0 and remaining > 0)
+            offset += sent
     
-    def organize_files_batch(self, files: List[Dict[str, Any]], 
+    def organize_files_batch(self, files: Iterable[Dict[str, Any]], 
                            dry_run: bool = False, 
-                           progress_callback=None) -> Dict[str, Any]:
+                           progress_callback=None,
+                           skip_dedup_check: bool = False,
+                           file_callback=None) -> Dict[str, Any]:
         """
         Organize multiple files with progress reporting
         
         Args:
-            files: List of file information dictionaries
+            files: List or iterable (e.g. FileScanner.iter_scan_folder) of file information dictionaries
             dry_run: If True, don't actually copy files
-            progress_callback: Optional callback function for progress updates
+            progress_callback: Optional callback function for progress updates, called on this
+                               thread with (completed, total, stats); for a streamed iterable
+                               total is the number of files read so far
+            skip_dedup_check: If True, skip deduplication checks (files were already batch-filtered)
+            file_callback: Optional callback called on this thread as each file finishes (in
+                           completion order) with (file_info, success, target_path)
             
         Returns:
             Dictionary with batch processing results
         """
-        self.logger.info(f"Starting batch organization of {len(files)} files")
+        # Streamed input has no length up front; organizing starts with the first file
+        total_files = len(files) if hasattr(files, '__len__') else None
+        if total_files is None:
+            self.logger.info("Starting batch organization of streamed files")
+        else:
+            self.logger.info("Starting batch organization of %s files", total_files)
         
         # Reset statistics
-        self.stats = {
-            'files_processed': 0,
-            'files_copied': 0,
-            'files_skipped': 0,
-            'files_failed': 0,
-            'bytes_copied': 0,
-            'directories_created': 0,
-            'duplicates_found': 0
-        }
-        
-        successful_files = []
-        failed_files = []
+        self.stats = OrganizerStats()
+        self._ensured_folders.clear()
         
-        for i, file_info in enumerate(files):
-            try:
-                success, target_path = self.organize_file(file_info, dry_run)
-                
-                if success:
-                    successful_files.append({
-                        'source': file_info['path'],
-                        'target': target_path,
-                        'filename': file_info['name']
-                    })
+        # One (file_info, target_path, error) slot per input file, filled by position as
+        # files finish (copies can complete out of order); pre-sized when the length is known
+        outcomes = [None] * total_files if total_files is not None else []
+
+        # Target resolution, dedup checks and stats stay on this thread; only the copies
+        # (kernel-side I/O that releases the GIL) run on the worker pool
+        max_workers = get_max_workers(self.config)
+        max_in_flight = max_workers * 2
+        pending = {}  # future -> (index, file_info, target_file_path, final_filename)
+        in_flight_sizes = set()
+        in_flight_paths = set()
+        log_interval = max(1, int(self.config.get('performance', {}).get('progress_reporting_interval', 100)))
+
+        def finish(index: int, file_info: Dict[str, Any], target_path: Optional[str], error: Optional[str]):
+            outcomes[index] = (file_info, target_path, error)
+            if file_callback:
+                file_callback(file_info, error is None, target_path)
+            
+            # Progress reporting (files_processed is counted once per file before finish)
+            completed = self.stats.files_processed
+            if progress_callback and completed % 10 == 0:
+                progress_callback(completed, total_files if total_files is not None else len(outcomes),
+                                  self.stats.as_dict())
+            
+            # Log progress every progress_reporting_interval files
+            if completed % log_interval == 0:
+                if total_files:
+                    progress_pct = (completed / total_files) * 100
+                    self.logger.info("Progress: %.1f%% (%s/%s)", progress_pct, completed, total_files)
                 else:
-                    failed_files.append({
-                        'source': file_info['path'],
-                        'filename': file_info['name'],
-                        'error': 'Organization failed'
-                    })
-                
-                # Progress reporting
-                if progress_callback and (i + 1) % 10 == 0:
-                    progress_callback(i + 1, len(files), self.stats)
-                
-                # Log progress periodically
-                if (i + 1) % 100 == 0:
-                    progress_pct = ((i + 1) / len(files)) * 100
-                    self.logger.info(f"Progress: {progress_pct:.1f}% ({i + 1}/{len(files)})")
+                    self.logger.info("Progress: %s files", completed)
+
+        def record_failure(index: int, file_info: Dict[str, Any], error: Exception):
+            self.logger.error("Unexpected error processing %s: %s", file_info.get('path', 'unknown'), error)
+            finish(index, file_info, None, str(error))
+
+        def collect(done_futures):
+            for future in done_futures:
+                index, file_info, target_file_path, final_filename = pending.pop(future)
+                in_flight_sizes.discard(file_info['size'])
+                in_flight_paths.discard(_path_key(target_file_path))
+                try:
+                    success, target_path = self._record_copy(
+                        file_info, target_file_path, final_filename, future.result(), dry_run
+                    )
+                except Exception as e:
+                    self.stats.files_failed += 1
+                    self.stats.files_processed += 1
+                    record_failure(index, file_info, e)
+                    continue
+                self.stats.files_processed += 1
+                finish(index, file_info, target_path, None if success else 'Organization failed')
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for index, file_info in enumerate(files):
+                if index == len(outcomes):
+                    outcomes.append(None)
+                try:
+                    # Dedup matches (exact or flexible) always require equal sizes, so a
+                    # same-sized file still being copied must land (and enter the dedup
+                    # cache) before this one is checked, exactly as in a serial run
+                    if not skip_dedup_check and file_info['size'] in in_flight_sizes:
+                        collect(list(pending))
+
+                    status, target_file_path, final_filename = self._plan_copy(file_info, skip_dedup_check)
+                    if status == 'copy' and _path_key(target_file_path) in in_flight_paths:
+                        collect(list(pending))
+                        status, target_file_path, final_filename = self._plan_copy(file_info, skip_dedup_check)
+
+                    if status != 'copy':
+                        self.stats.files_processed += 1
+                        if status == 'duplicate':
+                            finish(index, file_info, target_file_path, None)
+                        else:
+                            finish(index, file_info, None, 'Organization failed')
+                        continue
+
+                    future = executor.submit(self._copy_file, file_info['path'], target_file_path,
+                                             file_info, dry_run)
+                    pending[future] = (index, file_info, target_file_path, final_filename)
+                    in_flight_sizes.add(file_info['size'])
+                    in_flight_paths.add(_path_key(target_file_path))
+
+                    if len(pending) >= max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
                 
-            except Exception as e:
-                self.logger.error(f"Unexpected error processing {file_info.get('path', 'unknown')}: {e}")
-                failed_files.append({
-                    'source': file_info.get('path', 'unknown'),
-                    'filename': file_info.get('name', 'unknown'),
-                    'error': str(e)
-                })
+                except Exception as e:
+                    self.stats.files_failed += 1
+                    self.stats.files_processed += 1
+                    record_failure(index, file_info, e)
+
+            collect(list(pending))
+        
+        total_files = len(outcomes)
+        
+        # Split outcomes once, in input order
+        successful_files = [
+            {'source': file_info['path'], 'target': target_path, 'filename': file_info['name']}
+            for file_info, target_path, error in outcomes if error is None
+        ]
+        failed_files = [
+            {'source': file_info.get('path', 'unknown'), 'filename': file_info.get('name', 'unknown'), 'error': error}
+            for file_info, target_path, error in outcomes if error is not None
+        ]
         
         # Final progress report
         if progress_callback:
-            progress_callback(len(files), len(files), self.stats)
+            progress_callback(total_files, total_files, self.stats.as_dict())
         
         results = {
-            'total_files': len(files),
+            'total_files': total_files,
             'successful_files': successful_files,
             'failed_files': failed_files,
-            'statistics': self.stats.copy(),
-            'success_rate': (len(successful_files) / len(files)) * 100 if files else 0
+            'statistics': self.stats.as_dict(),
+            'success_rate': (len(successful_files) / total_files) * 100 if total_files else 0
         }
         
-        self.logger.info(f"Batch organization complete: {len(successful_files)} successful, "
-                        f"{len(failed_files)} failed, {self.stats['files_skipped']} skipped")
+        self.logger.info("Batch organization complete: %s successful, %s failed, %s skipped",
+                         len(successful_files), len(failed_files), self.stats.files_skipped)
         
         return results
-    
+
     def get_organization_preview(self, files: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Preview where files would be organized without actually copying them
@@ -264,6 +490,12 @@ class FileOrganizer:
             'potential_issues': []
         }
         
+        # Many files share a day; format each day once
+        date_labels = {}
+        
+        # Target folder -> (exists, normcased entry names); one scandir per distinct folder
+        folder_listings = {}
+        
         for file_info in files:
             try:
                 target_folder = self.target_resolver.get_target_folder_path(file_info)
@@ -275,9 +507,25 @@ class FileOrganizer:
                         file_info['date'], target_folder
                     )
                     
-                    target_file_path, final_filename = self.target_resolver.get_target_file_path(
-                        file_info, target_folder
-                    )
+                    listing = folder_listings.get(target_folder)
+                    if listing is None:
+                        listing = folder_listings[target_folder] = self._list_folder_names(target_folder)
+                    folder_exists, folder_names = listing
+                    
+                    # Only a possible collision needs the resolver (and its stat calls)
+                    if folder_names is not None and os.path.normcase(file_info['name']) not in folder_names:
+                        target_file_path = os.path.join(os.path.normpath(target_folder), file_info['name'])
+                        final_filename = file_info['name']
+                    else:
+                        target_file_path, final_filename = self.target_resolver.get_target_file_path(
+                            file_info, target_folder
+                        )
+                    
+                    file_date = file_info['date']
+                    day_key = (file_date.year, file_date.month, file_date.day)
+                    date_label = date_labels.get(day_key)
+                    if date_label is None:
+                        date_label = date_labels[day_key] = file_date.strftime('%Y-%m-%d')
                     
                     plan_item = {
                         'source': file_info['path'],
@@ -286,7 +534,7 @@ class FileOrganizer:
                         'final_filename': final_filename,
                         'would_skip': would_skip,
                         'file_type': file_info['type'],
-                        'date': file_info['date'].strftime('%Y-%m-%d'),
+                        'date': date_label,
                         'size_mb': round(file_info['size'] / (1024 * 1024), 2)
                     }
                     
@@ -296,7 +544,7 @@ class FileOrganizer:
                             f"Name collision: {file_info['name']} -> {final_filename}"
                         )
                     
-                    if not os.path.exists(target_folder):
+                    if not folder_exists:
                         if not self.config['options']['create_missing_folders']:
                             preview['potential_issues'].append(
                                 f"Target folder does not exist and creation disabled: {target_folder}"
@@ -323,9 +571,29 @@ class FileOrganizer:
         
         return preview
     
+    @staticmethod
+    def _list_folder_names(folder: str) -> Tuple[bool, Optional[set]]:
+        """
+        List a target folder once for preview collision checks
+        
+        Args:
+            folder: Target folder path
+            
+        Returns:
+            Tuple of (folder_exists, set of os.path.normcase'd entry names); the set is
+            empty for a missing folder and None if the folder could not be listed
+        """
+        try:
+            with os.scandir(folder) as entries:
+                return True, {os.path.normcase(entry.name) for entry in entries}
+        except FileNotFoundError:
+            return False, set()
+        except OSError:
+            return os.path.exists(folder), None
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get current processing statistics"""
-        stats = self.stats.copy()
+        stats = self.stats.as_dict()
         
         # Add calculated fields
         if stats['files_processed'] > 0:
@@ -346,8 +614,8 @@ class FileOrganizer:
     def get_organization_statistics(self) -> Dict[str, Any]:
         """Get file organization statistics"""
         return {
-            'files_organized': self.stats.get('files_copied', 0),
-            'folders_created': self.stats.get('directories_created', 0),
-            'collisions_resolved': self.stats.get('duplicates_found', 0),
-            'errors': self.stats.get('files_failed', 0)
+            'files_organized': self.stats.files_copied,
+            'folders_created': self.stats.directories_created,
+            'collisions_resolved': self.stats.duplicates_found,
+            'errors': self.stats.files_failed
         }
@@ -7,8 +7,13 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple
 import re
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+
+from .config_manager import get_max_workers
 
 class FileScanner:
     """Scans source directories for supported files and extracts metadata"""
@@ -22,6 +27,11 @@ class FileScanner:
         self.picture_extensions = [ext.lower() for ext in config['file_extensions']['pictures']]
         self.video_extensions = [ext.lower() for ext in config['file_extensions']['videos']]
         self.all_extensions = self.picture_extensions + self.video_extensions
+
+        # Extension -> (canonical extension string, file type); every file_info shares these
+        # string objects instead of holding its own lowercased copy
+        self._extension_info = {ext: (ext, 'video') for ext in self.video_extensions}
+        self._extension_info.update((ext, (ext, 'picture')) for ext in self.picture_extensions)
         
         # Date extraction patterns for real-world file naming
         # Updated to handle actual patterns: 20250406_110016_1.mp4, 20250622_100122.mp4, M4H01890.MP4
@@ -38,6 +48,9 @@ class FileScanner:
             r'(\d{2})-(\d{2})-(\d{4})',  # MM-DD-YYYY
             r'(\d{2})_(\d{2})_(\d{4})',  # MM_DD_YYYY
         ]
+
+        # Compile once; re.search(str) pays a pattern-cache lookup on every call
+        self._compiled_date_patterns = [re.compile(pattern) for pattern in self.date_patterns]
     
     def scan_folder(self, source_path: str) -> List[Dict[str, Any]]:
         """
@@ -49,77 +62,175 @@ class FileScanner:
         Returns:
             List of file information dictionaries
         """
+        return list(self.iter_scan_folder(source_path))
+
+    def iter_scan_folder(self, source_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Scan a source folder recursively, yielding file information as it is found
+        
+        Args:
+            source_path: Path to source folder to scan
+            
+        Yields:
+            File information dictionaries, in the same order as scan_folder
+        """
         source_path = Path(source_path)
         
         if not source_path.exists():
-            self.logger.error(f"Source folder does not exist: {source_path}")
-            return []
+            self.logger.error("Source folder does not exist: %s", source_path)
+            return
         
         if not source_path.is_dir():
-            self.logger.error(f"Source path is not a directory: {source_path}")
-            return []
+            self.logger.error("Source path is not a directory: %s", source_path)
+            return
         
-        self.logger.info(f"Scanning folder: {source_path}")
+        self.logger.info("Scanning folder: %s", source_path)
         
-        files_found = []
+        # Files directly in the source folder are scanned here; each top-level
+        # subfolder is walked on a worker thread (scandir/stat release the GIL)
+        root_files = []
         
         try:
-            # Recursively scan for files
-            for file_path in source_path.rglob('*'):
-                if file_path.is_file():
-                    file_info = self._extract_file_info(file_path)
-                    if file_info:
-                        files_found.append(file_info)
+            subdirs = self._scan_directory(str(source_path), root_files)
+        except Exception as e:
+            self.logger.error("Error scanning folder %s: %s", source_path, e)
+            yield from root_files
+            return
+
+        files_yielded = len(root_files)
+        yield from root_files
+        del root_files
+
+        if subdirs:
+            max_workers = get_max_workers(self.config)
+            # Only a window of subfolders is scanned ahead of the consumer, so at most
+            # max_workers * 2 subtree file lists are held in memory at once
+            max_in_flight = max_workers * 2
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirs))) as executor:
+                pending = deque()
+                next_subdir = iter(subdirs)
+                try:
+                    for dir_path in islice(next_subdir, max_in_flight):
+                        pending.append(executor.submit(self._scan_subtree, dir_path))
+                    # Results are taken in submit order, so they match a sequential walk
+                    while pending:
+                        subtree_files = pending.popleft().result()
+                        for dir_path in islice(next_subdir, 1):
+                            pending.append(executor.submit(self._scan_subtree, dir_path))
+                        files_yielded += len(subtree_files)
+                        yield from subtree_files
+                        del subtree_files
+                finally:
+                    # The consumer stopped early: drop subfolders that have not started
+                    for future in pending:
+                        future.cancel()
+        
+        self.logger.info("Found %s supported files in %s", files_yielded, source_path)
+
+    def _scan_subtree(self, dir_path: str) -> List[Dict[str, Any]]:
+        """
+        Recursively scan one subfolder for supported files
+        
+        Args:
+            dir_path: Path to the subfolder
             
-            self.logger.info(f"Found {len(files_found)} supported files in {source_path}")
+        Returns:
+            List of file information dictionaries in depth-first order
+        """
+        files_found = []
+        
+        try:
+            # Depth-first walk (same order as rglob, symlinked dirs not followed)
+            pending_dirs = [dir_path]
+            while pending_dirs:
+                current_dir = pending_dirs.pop()
+                try:
+                    subdirs = self._scan_directory(current_dir, files_found)
+                except PermissionError as e:
+                    self.logger.warning("Skipping unreadable folder %s: %s", current_dir, e)
+                    continue
+                pending_dirs.extend(reversed(subdirs))
             
         except Exception as e:
-            self.logger.error(f"Error scanning folder {source_path}: {e}")
+            self.logger.error("Error scanning folder %s: %s", dir_path, e)
         
         return files_found
+
+    def _scan_directory(self, dir_path: str, files_found: List[Dict[str, Any]]) -> List[str]:
+        """
+        Scan the entries of a single directory
+        DirEntry caches its type and stat, so each file costs at most one stat call
+        
+        Args:
+            dir_path: Directory to scan
+            files_found: List that supported file information is appended to
+            
+        Returns:
+            Paths of subdirectories, in directory order
+        """
+        subdirs = []
+        extension_lookup = self._extension_info.get
+        splitext = os.path.splitext
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                # Extension test first: unsupported entries (.db, .nomedia, thumbnails) only
+                # need a type check if they might be directories
+                extension_info = extension_lookup(splitext(entry.name)[1].lower())
+                if extension_info is not None and entry.is_file():
+                    file_info = self._extract_file_info(entry, extension_info)
+                    if file_info:
+                        files_found.append(file_info)
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+        return subdirs
     
-    def _extract_file_info(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def _extract_file_info(self, file_path: Union[Path, os.DirEntry],
+                           extension_info: Optional[Tuple[str, str]] = None) -> Optional[Dict[str, Any]]:
         """
         Extract file information and metadata
         
         Args:
-            file_path: Path to file
+            file_path: Path or os.DirEntry for the file (a DirEntry reuses its cached stat)
+            extension_info: (extension, file type) if the caller already looked it up
             
         Returns:
             Dictionary with file information or None if not supported
         """
         try:
             # Check if file extension is supported
-            extension = file_path.suffix.lower()
-            if extension not in self.all_extensions:
-                return None
+            filename = file_path.name
+            if extension_info is None:
+                extension_info = self._extension_info.get(os.path.splitext(filename)[1].lower())
+                if extension_info is None:
+                    return None
+            
+            # Determine file type
+            extension, file_type = extension_info
             
             # Get file stats
             stat_info = file_path.stat()
+            modification_time = datetime.fromtimestamp(stat_info.st_mtime)
             
-            # Determine file type
-            file_type = 'picture' if extension in self.picture_extensions else 'video'
-            
-            # Extract date from filename or use modification time
-            file_date = self._extract_date_from_filename(file_path.name)
+            # Extract date from filename or use modification time (same object, datetimes are immutable)
+            file_date = self._extract_date_from_filename(filename)
             if not file_date:
-                file_date = datetime.fromtimestamp(stat_info.st_mtime)
+                file_date = modification_time
             
             file_info = {
-                'path': str(file_path),
-                'name': file_path.name,
+                'path': os.fspath(file_path),
+                'name': filename,
                 'extension': extension,
                 'type': file_type,
                 'size': stat_info.st_size,
                 'date': file_date,
-                'modification_time': datetime.fromtimestamp(stat_info.st_mtime),
+                'modification_time': modification_time,
                 'creation_time': datetime.fromtimestamp(stat_info.st_ctime),
             }
             
             return file_info
             
         except Exception as e:
-            self.logger.warning(f"Error extracting info for {file_path}: {e}")
+            self.logger.warning("Error extracting info for %s: %s", file_path, e)
             return None
     
     def _extract_date_from_filename(self, filename: str) -> Optional[datetime]:
@@ -132,8 +243,8 @@ class FileScanner:
         Returns:
             Datetime object if date found, None otherwise
         """
-        for pattern in self.date_patterns:
-            match = re.search(pattern, filename)
+        for pattern in self._compiled_date_patterns:
+            match = pattern.search(filename)
             if match:
                 try:
                     groups = match.groups()
@@ -188,16 +299,29 @@ class FileScanner:
                 'date_range': None
             }
         
-        pictures = [f for f in files if f['type'] == 'picture']
-        videos = [f for f in files if f['type'] == 'video']
-        total_size = sum(f['size'] for f in files)
+        # Single pass over files for counts, size, date range and extensions
+        pictures = videos = total_size = 0
+        min_date = max_date = None
+        extensions = set()
+        for f in files:
+            file_type = f['type']
+            if file_type == 'picture':
+                pictures += 1
+            elif file_type == 'video':
+                videos += 1
+            total_size += f['size']
+            extensions.add(f['extension'])
+            
+            file_date = f['date']
+            if file_date:
+                if min_date is None or file_date < min_date:
+                    min_date = file_date
+                if max_date is None or file_date > max_date:
+                    max_date = file_date
         
         # Get date range
-        dates = [f['date'] for f in files if f['date']]
         date_range = None
-        if dates:
-            min_date = min(dates)
-            max_date = max(dates)
+        if min_date is not None:
             date_range = {
                 'earliest': min_date.strftime('%Y-%m-%d'),
                 'latest': max_date.strftime('%Y-%m-%d')
@@ -205,12 +329,12 @@ class FileScanner:
         
         return {
             'total_files': len(files),
-            'pictures': len(pictures),
-            'videos': len(videos),
+            'pictures': pictures,
+            'videos': videos,
             'total_size': total_size,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
             'date_range': date_range,
-            'extensions': list(set(f['extension'] for f in files))
+            'extensions': list(extensions)
         }
     
     def filter_files_by_date_range(self, files: List[Dict[str, Any]], 
@@ -252,17 +376,20 @@ class FileScanner:
         Returns:
             Dictionary with date strings as keys and file lists as values
         """
-        grouped_files = {}
+        # Group on (year, month, day) tuples and format each distinct day once
+        grouped_by_day = {}
         
         for file_info in files:
-            date_key = file_info['date'].strftime('%Y-%m-%d')
+            file_date = file_info['date']
+            day_key = (file_date.year, file_date.month, file_date.day)
             
-            if date_key not in grouped_files:
-                grouped_files[date_key] = []
+            if day_key not in grouped_by_day:
+                grouped_by_day[day_key] = []
             
-            grouped_files[date_key].append(file_info)
+            grouped_by_day[day_key].append(file_info)
         
-        return grouped_files
+        return {f"{year:04d}-{month:02d}-{day:02d}": day_files
+                for (year, month, day), day_files in grouped_by_day.items()}
 
     def get_scan_statistics(self) -> Dict[str, Any]:
         """
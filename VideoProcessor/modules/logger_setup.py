@@ -3,11 +3,57 @@ Logging Setup for PhoneSync + VideoProcessor
 Configures comprehensive logging with rotation and retention
 """
 
+import os
+import queue
+import atexit
 import logging
 import logging.handlers
 from pathlib import Path
 from typing import Dict, Any
 
+# Write buffer for the log file; the MemoryHandler in front decides when it is flushed
+_LOG_BUFFER_SIZE = 1024 * 1024
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a 1 MiB buffer
+    Rollover is decided from a running size count, so a record costs no seek/tell (which
+    would flush the buffer) and no exists/isfile stat calls; the stream is only flushed
+    through flush_stream, on rollover and on close
+    """
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+                      encoding=self.encoding, errors=self.errors)
+        self._stream_size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes > 0:
+            message_size = len(self.format(record)) + 1
+            if self._stream_size + message_size >= self.maxBytes:
+                return True
+            self._stream_size += message_size
+        return False
+
+    def flush(self):
+        """Skip the per-record flush StreamHandler.emit does; see flush_stream"""
+
+    def flush_stream(self):
+        """Flush buffered records to the log file"""
+        super().flush()
+
+class BatchFlushMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its target's file buffer after each batch"""
+
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target:
+                self.target.flush_stream()
+
 def setup_logging(config: Dict[str, Any]) -> logging.Logger:
     """
     Set up comprehensive logging system
@@ -24,8 +70,19 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
     logger = logging.getLogger('phone_sync')
     logger.setLevel(getattr(logging, log_config.get('log_level', 'INFO')))
     
-    # Clear any existing handlers
+    # Stop a listener from an earlier setup (drains its queue), then clear existing
+    # handlers (closing flushes any buffered file records)
+    previous_listener = getattr(logger, '_listener', None)
+    if previous_listener is not None:
+        previous_listener.stop()
+        atexit.unregister(previous_listener.stop)
+        for handler in previous_listener.handlers:
+            handler.close()
+        logger._listener = None
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
+    output_handlers = []
     
     # Create formatters
     detailed_formatter = logging.Formatter(
@@ -41,7 +98,7 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    output_handlers.append(console_handler)
     
     # File handler (if logging enabled)
     if log_config.get('enabled', True):
@@ -54,7 +111,7 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
         max_bytes = log_config.get('max_log_size_mb', 10) * 1024 * 1024
         backup_count = log_config.get('keep_log_days', 14)
         
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_path,
             maxBytes=max_bytes,
             backupCount=backup_count,
@@ -63,13 +120,34 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
         
         file_handler.setLevel(getattr(logging, log_config.get('log_level', 'INFO')))
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        
+        # Buffer file records so the log file is written in batches instead of one
+        # write+flush per record; errors (and shutdown) flush immediately
+        buffered_handler = BatchFlushMemoryHandler(
+            capacity=log_config.get('buffer_records', 512),
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(file_handler.level)
+        output_handlers.append(buffered_handler)
     
     # Set verbose logging if requested
     if config['options'].get('verbose_logging', False):
         logger.setLevel(logging.DEBUG)
         console_handler.setLevel(logging.DEBUG)
     
+    # Log calls only enqueue the record; a background listener thread does the
+    # console/file I/O, so copy and scan threads never wait on the handler locks
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *output_handlers, respect_handler_level=True)
+    listener.start()
+    logger._listener = listener
+    
+    # Runs before logging's own shutdown hook (atexit is LIFO), so queued records
+    # reach the handlers before they are flushed and closed
+    atexit.register(listener.stop)
+    
     return logger
 
 def log_system_info(logger: logging.Logger, config: Dict[str, Any]):
@@ -6,7 +6,15 @@ Generates and manages notes files for video analysis results
 import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .config_manager import get_max_workers
+
+# A date's pending notes are written out early once they reach either limit, so a
+# large run neither holds every note in memory nor writes them all at the end
+_FLUSH_NOTE_COUNT = 4096
+_FLUSH_SIZE = 1024 * 1024
 
 class NotesGenerator:
     """
@@ -30,8 +38,13 @@ class NotesGenerator:
         self.wudan_base_path = config['target_paths']['wudan']
         self.notes_enabled = config['options'].get('generate_notes', True)
 
-        # Storage for notes to be written: date -> {'notes': [...], 'directory': 'path'}
+        # Storage for notes to be written:
+        # date -> {'notes': [...], 'directory': 'path', 'date_compact': 'YYYYMMDD',
+        #          'size': chars pending, 'header_written': bool}
         self.pending_notes = {}
+
+        # (year, month, day) -> (YYYY_MM_DD, YYYYMMDD); videos share a handful of dates
+        self._date_key_cache: Dict[Tuple[int, int, int], Tuple[str, str]] = {}
     
     def add_video_note(self, file_date: datetime, filename: str, description: str, video_directory: str, dry_run: bool = False):
         """
@@ -51,8 +64,13 @@ class NotesGenerator:
             self.logger.info(f"[DRY RUN] Would add note for {filename}: {description[:50]}...")
             return
 
-        # Format date for grouping
-        date_key = file_date.strftime("%Y_%m_%d")
+        # Format date for grouping (formatted once per day, not per note)
+        day = (file_date.year, file_date.month, file_date.day)
+        date_keys = self._date_key_cache.get(day)
+        if date_keys is None:
+            date_key = file_date.strftime("%Y_%m_%d")
+            date_keys = self._date_key_cache[day] = (date_key, date_key.replace("_", ""))
+        date_key, date_compact = date_keys
 
         # Create simple note entry (filename - description format)
         note_entry = {
@@ -64,12 +82,25 @@ class NotesGenerator:
         if date_key not in self.pending_notes:
             self.pending_notes[date_key] = {
                 'notes': [],
-                'directory': video_directory
+                'directory': video_directory,
+                'date_compact': date_compact,
+                'size': 0,
+                'header_written': False
             }
 
-        self.pending_notes[date_key]['notes'].append(note_entry)
+        note_data = self.pending_notes[date_key]
+        note_data['notes'].append(note_entry)
+        note_data['size'] += len(filename) + len(description) + 4
 
         self.logger.debug(f"Added note for {filename} on {date_key} in {video_directory}")
+
+        # Write this date's notes so far once they grow large; later writes append
+        if len(note_data['notes']) >= _FLUSH_NOTE_COUNT or note_data['size'] >= _FLUSH_SIZE:
+            self._write_notes_file(date_key, note_data['notes'], note_data['directory'],
+                                   append=note_data['header_written'], date_compact=date_compact)
+            note_data['notes'] = []
+            note_data['size'] = 0
+            note_data['header_written'] = True
     
     def write_all_notes(self):
         """
@@ -79,15 +110,25 @@ class NotesGenerator:
             return
 
         notes_count = len(self.pending_notes)
-        for date_key, note_data in self.pending_notes.items():
-            self._write_notes_file(date_key, note_data['notes'], note_data['directory'])
+        
+        # Each date is a separate file, so files are written concurrently
+        # (_write_notes_file logs its own errors)
+        max_workers = get_max_workers(self.config)
+        with ThreadPoolExecutor(max_workers=min(max_workers, notes_count)) as executor:
+            for date_key, note_data in self.pending_notes.items():
+                # Dates flushed early only need their remaining notes appended
+                if note_data['header_written'] and not note_data['notes']:
+                    continue
+                executor.submit(self._write_notes_file, date_key, note_data['notes'], note_data['directory'],
+                                append=note_data['header_written'], date_compact=note_data['date_compact'])
 
         # Clear pending notes after writing
         self.pending_notes.clear()
 
         self.logger.info(f"Generated notes files for {notes_count} dates")
     
-    def _write_notes_file(self, date_key: str, notes: List[Dict[str, Any]], video_directory: str):
+    def _write_notes_file(self, date_key: str, notes: List[Dict[str, Any]], video_directory: str,
+                          append: bool = False, date_compact: Optional[str] = None):
         """
         Write notes for a specific date to file in the video directory
         Format: filename - description (one per line)
@@ -96,21 +137,26 @@ class NotesGenerator:
             date_key: Date key (YYYY_MM_DD format)
             notes: List of note entries
             video_directory: Directory where the videos are stored
+            append: Append to a notes file already written this run (no header)
+            date_compact: Date in YYYYMMDD format, if already known
         """
         try:
             # Create notes filename: YYYYMMDD_Notes.txt
-            date_compact = date_key.replace("_", "")  # Convert YYYY_MM_DD to YYYYMMDD
+            if date_compact is None:
+                date_compact = date_key.replace("_", "")  # Convert YYYY_MM_DD to YYYYMMDD
             notes_filename = f"{date_compact}_Notes.txt"
             notes_filepath = Path(video_directory) / notes_filename
 
             # Write simple text format: filename - description
-            with open(notes_filepath, 'w', encoding='utf-8') as f:
-                f.write(f"Video Analysis Notes - {date_key}\n")
-                f.write("=" * 50 + "\n\n")
-
-                for note in notes:
-                    # Format: filename - description
-                    f.write(f"{note['filename']} - {note['description']}\n")
+            # The whole file is assembled first and written in one call (join over a
+            # list comprehension: join builds a list from a generator anyway)
+            body = "".join([f"{note['filename']} - {note['description']}\n" for note in notes])
+            if append:
+                with open(notes_filepath, 'a', encoding='utf-8') as f:
+                    f.write(body)
+            else:
+                header = f"Video Analysis Notes - {date_key}\n" + "=" * 50 + "\n\n"
+                notes_filepath.write_text(header + body, encoding='utf-8')
 
             self.logger.info(f"Generated notes file: {notes_filepath}")
 
@@ -151,7 +197,7 @@ class NotesGenerator:
         Returns:
             Statistics dictionary
         """
-        total_pending = sum(len(notes) for notes in self.pending_notes.values())
+        total_pending = sum(len(note_data['notes']) for note_data in self.pending_notes.values())
         
         return {
             'pending_notes': total_pending,
@@ -6,12 +6,159 @@ Implements incremental processing for hundreds/thousands of MP4s
 """
 
 import os
+import re
 import json
 import logging
+import hashlib
+import functools
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any, List, Optional, Set
-from dataclasses import dataclass, asdict
+from datetime import datetime, date
+from typing import Dict, Any, List, Optional, Set, Tuple, Callable, Iterator
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Marks a per-run cache slot that has not been filled yet (None is a valid result)
+_NOT_CACHED = object()
+
+# Size of one file id record in the binary snapshot (see _file_id)
+_FILE_ID_SIZE = 16
+
+# The snapshot is read in chunks of whole records, so loading never holds the whole
+# file in memory next to the set being built
+_SNAPSHOT_READ_SIZE = _FILE_ID_SIZE * 65536
+
+# Read buffer for the JSONL log, so a large log is read in a few big reads rather
+# than one per 8 KiB default buffer
+_LOG_READ_BUFFER_SIZE = 1024 * 1024
+
+# Fold the append-only log back into the binary snapshot once it holds more ids than
+# this multiple of the snapshot, so the snapshot rewrite is amortized across runs
+_LOG_COMPACT_RATIO = 1.0
+
+# Parsed state files shared by every manager in the process: path -> (stat signature, data)
+# A manager constructed again over unchanged files skips the JSON parsing
+_STATE_CACHE: Dict[str, Tuple[Any, Any]] = {}
+
+def resolve_state_dir(config: Dict[str, Any]) -> Path:
+    """
+    Resolve the configured state directory (state_management.state_dir)
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Path of the state directory (not created here)
+    """
+    state_dir_path = config.get('state_management', {}).get('state_dir', 'VideoProcessor/state')
+
+    # Handle relative paths - if running from VideoProcessor dir, adjust path
+    # (the prefix test comes first so other paths cost no existence probe)
+    state_dir = Path(state_dir_path)
+    if state_dir_path.startswith('VideoProcessor/') and not state_dir.exists():
+        # Try without VideoProcessor prefix (running from VideoProcessor directory)
+        alt_path = state_dir_path.replace('VideoProcessor/', '', 1)
+        if os.path.exists(alt_path) or os.path.exists(os.path.dirname(alt_path)):
+            state_dir = Path(alt_path)
+    return state_dir
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """Return (inode, mtime_ns, size) for a file, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _cached_read(path: Path, signature: Any, reader: Callable[[], Any]) -> Any:
+    """
+    Return reader()'s result for path, reusing the cached result while the signature matches
+    
+    Args:
+        path: File the data is read from (cache key)
+        signature: Stat signature of the file(s) the reader depends on
+        reader: Function that reads and parses the data; its result must not be mutated
+        
+    Returns:
+        Parsed data
+    """
+    key = str(path)
+    cached = _STATE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    data = reader()
+    _STATE_CACHE[key] = (signature, data)
+    return data
+
+# should_process_file and mark_file_processed both build the id of the same file,
+# and files from one dump share timestamps; isoformat is cached per datetime
+_isoformat = functools.lru_cache(maxsize=4096)(datetime.isoformat)
+
+def _file_id(file_info: Dict[str, Any]) -> bytes:
+    """
+    Build the 16-byte identifier for a file (BLAKE2b of path|size|date)
+    A fixed-size digest keeps the processed files set small however long the paths are
+    
+    Args:
+        file_info: File information dictionary
+        
+    Returns:
+        Digest bytes
+    """
+    key = f"{file_info['path']}|{file_info['size']}|{_isoformat(file_info['date'])}"
+    return hashlib.blake2b(key.encode('utf-8', 'surrogatepass'), digest_size=_FILE_ID_SIZE).digest()
+
+def _iter_snapshot_ids(f) -> Iterator[bytes]:
+    """
+    Yield the file id records of a binary snapshot, one read chunk at a time
+    A trailing partial record can only come from a torn write and is ignored
+    """
+    for chunk in iter(functools.partial(f.read, _SNAPSHOT_READ_SIZE), b''):
+        end = len(chunk) - len(chunk) % _FILE_ID_SIZE
+        yield from (chunk[i:i + _FILE_ID_SIZE] for i in range(0, end, _FILE_ID_SIZE))
+
+def _decode_file_id(entry: str) -> bytes:
+    """
+    Convert a stored file id to its digest
+    Current databases store hex digests; older ones stored the path|size|date
+    string itself, which hashes to the same digest _file_id produces
+    """
+    if len(entry) == 32 and '|' not in entry:
+        try:
+            return bytes.fromhex(entry)
+        except ValueError:
+            pass
+    return hashlib.blake2b(entry.encode('utf-8', 'surrogatepass'), digest_size=_FILE_ID_SIZE).digest()
+
+# Date folder names: YYYY_MM_DD, optionally followed by _suffix (Wudan folders only)
+_FOLDER_DATE_RE = re.compile(r'(\d+)_(\d+)_(\d+)(_.*)?', re.DOTALL)
+
+@functools.lru_cache(maxsize=8192)
+def _parse_folder_date(folder_name: str, path_type: str) -> Optional[date]:
+    """
+    Parse date from folder name based on expected patterns
+    Cached: the same target folder names are parsed on every validation pass
+
+    Args:
+        folder_name: Name of the folder
+        path_type: Type of target path (wudan, videos, pictures)
+
+    Returns:
+        Parsed date or None if folder name doesn't match expected pattern
+    """
+    match = _FOLDER_DATE_RE.fullmatch(folder_name)
+    if match is None:
+        return None
+
+    # Wudan folders: YYYY_MM_DD_DDD (with day of week, may carry more suffixes)
+    # Regular folders: exactly YYYY_MM_DD
+    if match[4] is not None and path_type != 'wudan':
+        return None
+
+    try:
+        return date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        # Not a valid date folder
+        return None
 
 @dataclass
 class ProcessingState:
@@ -42,16 +189,7 @@ class ProcessingStateManager:
         
         # State file location from config
         state_config = config.get('state_management', {})
-        state_dir_path = state_config.get('state_dir', 'VideoProcessor/state')
-
-        # Handle relative paths - if running from VideoProcessor dir, adjust path
-        if not os.path.exists(state_dir_path) and state_dir_path.startswith('VideoProcessor/'):
-            # Try without VideoProcessor prefix (running from VideoProcessor directory)
-            alt_path = state_dir_path.replace('VideoProcessor/', '', 1)
-            if os.path.exists(alt_path) or os.path.exists(os.path.dirname(alt_path)):
-                state_dir_path = alt_path
-
-        self.state_dir = Path(state_dir_path)
+        self.state_dir = resolve_state_dir(config)
         self.state_dir.mkdir(exist_ok=True)
 
         # State file names from config
@@ -61,9 +199,36 @@ class ProcessingStateManager:
         self.state_file = self.state_dir / state_file_name
         self.processed_files_db = self.state_dir / processed_files_name
         
+        # fsync state writes so a crash or power loss cannot lose a completed run
+        self.durable = state_config.get('durable', True)
+        
+        # Processed file ids live in a binary snapshot (raw 16-byte digests back to back)
+        # plus a JSONL log that new ids are appended to, instead of rewriting the whole
+        # database on every save; processed_files_db itself is the older JSON format,
+        # read if present and replaced by the snapshot on the next compaction
+        self.processed_files_snapshot = self.processed_files_db.with_suffix('.bin')
+        self.processed_files_log = self.processed_files_db.with_suffix('.jsonl')
+        
         # Current state
         self.current_state: Optional[ProcessingState] = None
-        self.processed_files: Set[str] = set()
+        self.processed_files: Set[bytes] = set()
+        
+        # Ids marked since the last save; kept apart from the (large) loaded set so adds
+        # during a run never resize it, and merged in when they are appended to the log
+        self._pending_adds: Set[bytes] = set()
+        self._snapshot_count = 0
+        self._log_count = 0
+        
+        # Set when there is anything _save_state would need to write
+        self._dirty = False
+        
+        # last_run_timestamp parsed once, not per file (see _get_last_run_time)
+        self._last_run_timestamp: Optional[str] = None
+        self._last_run_time: Optional[datetime] = None
+        
+        # Target folder checks, done once per run rather than once per file
+        self._validation_cached: Optional[bool] = None
+        self._last_folder_date_cached: Any = _NOT_CACHED
         
         # Load existing state
         self._load_state()
@@ -72,53 +237,189 @@ class ProcessingStateManager:
     
     def _load_state(self):
         """Load processing state from disk"""
+        # The main state and the processed files database are loaded independently,
+        # so a damaged file only loses what it holds
         try:
             # Load main state
-            if self.state_file.exists():
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    state_data = json.load(f)
-                    self.current_state = ProcessingState(**state_data)
-                    self.logger.info(f"Loaded processing state: last run {self.current_state.last_run_timestamp}")
+            state_signature = _stat_signature(self.state_file)
+            if state_signature is not None:
+                state_data = _cached_read(self.state_file, state_signature, self._read_state_data)
+                self.current_state = ProcessingState(**state_data)
+                self.logger.info(f"Loaded processing state: last run {self.current_state.last_run_timestamp}")
             else:
                 self.logger.info("No previous processing state found - first run")
                 
-            # Load processed files database
-            if self.processed_files_db.exists():
-                with open(self.processed_files_db, 'r', encoding='utf-8') as f:
-                    processed_data = json.load(f)
-                    self.processed_files = set(processed_data.get('processed_files', []))
-                    self.logger.info(f"Loaded {len(self.processed_files)} previously processed files")
+        except Exception as e:
+            self.logger.warning(f"Error loading processing state: {e}")
+            self.current_state = None
+        
+        try:
+            # Load processed files database (snapshot plus append-only log)
+            files_signature = (_stat_signature(self.processed_files_snapshot),
+                               _stat_signature(self.processed_files_db),
+                               _stat_signature(self.processed_files_log))
+            if files_signature != (None, None, None):
+                snapshot_ids, log_ids = _cached_read(self.processed_files_snapshot, files_signature,
+                                                     self._read_processed_files)
+                self.processed_files = set(snapshot_ids)
+                self._snapshot_count = len(self.processed_files)
+                self.processed_files.update(log_ids)
+                self._log_count = len(self.processed_files) - self._snapshot_count
+                self.logger.info(f"Loaded {len(self.processed_files)} previously processed files")
             else:
                 self.logger.info("No processed files database found - first run")
                 
         except Exception as e:
-            self.logger.warning(f"Error loading processing state: {e}")
-            self.current_state = None
+            self.logger.warning(f"Error loading processed files database: {e}")
             self.processed_files = set()
+            self._snapshot_count = 0
+            self._log_count = 0
+    
+    def _read_state_data(self) -> Dict[str, Any]:
+        """Read the main processing state file"""
+        # One binary read and one decode, without the text-layer wrapper
+        with open(self.state_file, 'rb') as f:
+            return json.loads(f.read())
+    
+    def _read_processed_files(self) -> Tuple[frozenset, frozenset]:
+        """
+        Read the processed files snapshot and append-only log
+        Ids from an older JSON database count as logged, so the next save compacts
+        them into the binary snapshot
+        
+        Returns:
+            (snapshot file ids, logged file ids); either is empty if its files are missing
+        """
+        snapshot_ids = frozenset()
+        log_ids = set()
+        
+        if self.processed_files_snapshot.exists():
+            with open(self.processed_files_snapshot, 'rb') as f:
+                snapshot_ids = frozenset(_iter_snapshot_ids(f))
+        
+        if self.processed_files_db.exists():
+            with open(self.processed_files_db, 'rb') as f:
+                processed_data = json.loads(f.read())
+            log_ids.update(map(_decode_file_id, processed_data.get('processed_files', [])))
+        
+        if self.processed_files_log.exists():
+            with open(self.processed_files_log, 'r', encoding='utf-8', errors='replace',
+                      buffering=_LOG_READ_BUFFER_SIZE) as f:
+                # Each line is one JSON-encoded file id; blank lines are skipped
+                skipped_lines = 0
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        entry = None
+                    if not isinstance(entry, str):
+                        # A torn append (crash, full disk) leaves a partial last line
+                        skipped_lines += 1
+                        continue
+                    log_ids.add(_decode_file_id(entry))
+            if skipped_lines:
+                self.logger.warning(f"Skipped {skipped_lines} unreadable line(s) in {self.processed_files_log}")
+        
+        return snapshot_ids, frozenset(log_ids)
     
     def _save_state(self):
         """Save processing state to disk"""
+        if not self._dirty:
+            self.logger.debug("Processing state unchanged, skipping save")
+            return
+        
         try:
             # Save main state
             if self.current_state:
-                with open(self.state_file, 'w', encoding='utf-8') as f:
-                    json.dump(asdict(self.current_state), f, indent=2)
+                # Flat dataclass: build the dict directly instead of asdict's recursive copy
+                state = self.current_state
+                state_data = {
+                    'last_run_timestamp': state.last_run_timestamp,
+                    'last_processed_file': state.last_processed_file,
+                    'last_processed_date': state.last_processed_date,
+                    'total_files_processed': state.total_files_processed,
+                    'total_videos_analyzed': state.total_videos_analyzed,
+                    'processing_version': state.processing_version
+                }
+                payload = json.dumps(state_data, indent=2).encode('utf-8')
+                self._replace_file(self.state_file, payload)
                     
-            # Save processed files database
-            processed_data = {
-                'processed_files': list(self.processed_files),
-                'last_updated': datetime.now().isoformat(),
-                'total_count': len(self.processed_files)
-            }
-            
-            with open(self.processed_files_db, 'w', encoding='utf-8') as f:
-                json.dump(processed_data, f, indent=2)
+            # Append ids marked since the last save; rewrite the snapshot only when
+            # the log has grown large relative to it
+            self._append_pending_ids()
+            if self._log_count > self._snapshot_count * _LOG_COMPACT_RATIO:
+                self._compact_processed_files()
                 
+            self._dirty = False
             self.logger.info(f"Saved processing state: {len(self.processed_files)} processed files tracked")
             
         except Exception as e:
             self.logger.error(f"Error saving processing state: {e}")
     
+    def _append_pending_ids(self):
+        """
+        Append newly processed file ids to the JSONL log in a single write
+        The log is opened per save and closed again, so no handle outlives it (an open
+        handle would stop a later compaction or reset from deleting the log on Windows)
+        """
+        if not self._pending_adds:
+            return
+        
+        data = "".join(f'"{file_id.hex()}"\n' for file_id in self._pending_adds).encode('ascii')
+        
+        with open(self.processed_files_log, 'a+b') as f:
+            # Start on a fresh line if the log ends in a torn record, so the first
+            # appended id is not glued onto it
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+            if self.durable:
+                f.flush()
+                os.fsync(f.fileno())
+        
+        self._log_count += len(self._pending_adds)
+        self.processed_files |= self._pending_adds
+        self._pending_adds.clear()
+    
+    def _replace_file(self, path: Path, payload: bytes):
+        """
+        Write a state file atomically: one write to a temporary file, then os.replace
+        A crash leaves either the old file or the new one, never a torn write
+        
+        Args:
+            path: File to replace
+            payload: Complete new contents
+        """
+        temp_file = path.with_name(path.name + '.tmp')
+        with open(temp_file, 'wb') as f:
+            f.write(payload)
+            if self.durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    
+    def _compact_processed_files(self):
+        """Rewrite the binary snapshot with the full set and remove the JSONL log"""
+        # Fixed-size records: 16 bytes per file on disk (vs ~36 as JSON hex strings)
+        # and no parsing on load
+        payload = b"".join(self.processed_files)
+        
+        self._replace_file(self.processed_files_snapshot, payload)
+        
+        # Every logged id (and any older JSON database) is now in the snapshot
+        if self.processed_files_log.exists():
+            self.processed_files_log.unlink()
+        if self.processed_files_db.exists():
+            self.processed_files_db.unlink()
+        
+        self._snapshot_count = len(self.processed_files)
+        self._log_count = 0
+        self.logger.debug(f"Compacted processed files database: {self._snapshot_count} ids")
+    
     def should_process_file(self, file_info: Dict[str, Any]) -> bool:
         """
         Determine if a file should be processed based on state tracking
@@ -129,38 +430,60 @@ class ProcessingStateManager:
         Returns:
             True if file should be processed, False if already processed
         """
-        file_path = file_info['path']
         file_name = file_info['name']
         file_date = file_info['date']
 
-        # Create unique identifier for file (path + size + date)
-        file_id = f"{file_path}|{file_info['size']}|{file_date.isoformat()}"
-
-        # Check if file was already processed
-        if file_id in self.processed_files:
-            self.logger.debug(f"File already processed, skipping: {file_name}")
-            return False
-
-        # Enhanced incremental processing with validation
+        # Enhanced incremental processing with validation; the date checks come first
+        # so files skipped as old never have their id hashed
         if self.current_state and self.config['options'].get('enable_incremental_processing', True):
             # Validate that our state corresponds to actual target folder structure
             if self._validate_last_run_against_folders():
                 # State is valid, use timestamp-based filtering
-                last_run_time = datetime.fromisoformat(self.current_state.last_run_timestamp)
+                last_run_time = self._get_last_run_time()
                 if file_date <= last_run_time:
-                    self.logger.debug(f"File older than last run ({last_run_time}), skipping: {file_name}")
+                    self.logger.debug("File older than last run (%s), skipping: %s", last_run_time, file_name)
                     return False
             else:
                 # State validation failed, fall back to folder-based detection
                 self.logger.warning("State validation failed, falling back to folder-based last date detection")
                 last_folder_date = self._determine_last_process_date_from_folders()
                 if last_folder_date and file_date.date() <= last_folder_date:
-                    self.logger.debug(f"File older than last folder date ({last_folder_date}), skipping: {file_name}")
+                    self.logger.debug("File older than last folder date (%s), skipping: %s", last_folder_date, file_name)
                     return False
-        
+
+        # Create unique identifier for file (path + size + date)
+        file_id = _file_id(file_info)
+
+        # Check if file was already processed
+        if file_id in self.processed_files or file_id in self._pending_adds:
+            self.logger.debug("File already processed, skipping: %s", file_name)
+            return False
+
         return True
 
+    def _get_last_run_time(self) -> datetime:
+        """
+        Return current_state.last_run_timestamp as a datetime
+        Parsed again only when the state's timestamp changes
+        """
+        timestamp = self.current_state.last_run_timestamp
+        if timestamp != self._last_run_timestamp:
+            self._last_run_time = datetime.fromisoformat(timestamp)
+            self._last_run_timestamp = timestamp
+        return self._last_run_time
+
     def _validate_last_run_against_folders(self) -> bool:
+        """
+        Cached result of _check_last_run_folder for this run
+
+        Returns:
+            True if validation passes, False if we need folder-based fallback
+        """
+        if self._validation_cached is None:
+            self._validation_cached = self._check_last_run_folder()
+        return self._validation_cached
+
+    def _check_last_run_folder(self) -> bool:
         """
         Validate that the last_run_timestamp corresponds to actual target folder structure
 
@@ -177,45 +500,29 @@ class ProcessingStateManager:
 
         try:
             # Extract date from last_run_timestamp
-            last_run_datetime = datetime.fromisoformat(self.current_state.last_run_timestamp)
+            last_run_datetime = self._get_last_run_time()
             last_run_date = last_run_datetime.date()
             expected_folder = last_run_date.strftime('%Y_%m_%d')
 
             self.logger.debug(f"Validating last run date {expected_folder} against target folders")
 
-            # Check target directories for expected date folder
-            target_paths = self.config.get('target_paths', {})
+            # Check target directories for expected date folder; each target is listed
+            # on its own thread (they may be separate, slow network mounts) and the
+            # first match ends the check
+            target_paths = [(path_type, base_path) for path_type, base_path
+                            in self.config.get('target_paths', {}).items() if base_path]
             validation_passed = False
 
-            for path_type, base_path in target_paths.items():
-                if not base_path or not os.path.exists(base_path):
-                    continue
-
-                try:
-                    # Look for date folders in this target directory
-                    for item in os.listdir(base_path):
-                        item_path = os.path.join(base_path, item)
-                        if not os.path.isdir(item_path):
-                            continue
-
-                        # Check if this folder matches our expected date or is newer
-                        if path_type == 'wudan':
-                            # For Wudan folders, check YYYY_MM_DD_DDD pattern
-                            if item.startswith(expected_folder + '_'):
-                                validation_passed = True
-                                break
-                        else:
-                            # For regular folders, check YYYY_MM_DD pattern
-                            if item == expected_folder:
-                                validation_passed = True
-                                break
-
-                    if validation_passed:
-                        break
-
-                except (OSError, PermissionError) as e:
-                    self.logger.warning(f"Could not access target directory {base_path}: {e}")
-                    continue
+            if target_paths:
+                with ThreadPoolExecutor(max_workers=len(target_paths)) as executor:
+                    futures = [executor.submit(self._has_date_folder, path_type, base_path, expected_folder)
+                               for path_type, base_path in target_paths]
+                    for future in as_completed(futures):
+                        if future.result():
+                            validation_passed = True
+                            for pending in futures:
+                                pending.cancel()
+                            break
 
             if validation_passed:
                 self.logger.debug(f"State validation passed: found expected date folder {expected_folder}")
@@ -228,7 +535,59 @@ class ProcessingStateManager:
             self.logger.warning(f"Error during state validation: {e}")
             return False
 
+    def _has_date_folder(self, path_type: str, base_path: str, expected_folder: str) -> bool:
+        """
+        Check one target directory for the date folder of the last run
+
+        Args:
+            path_type: Type of target path (wudan, videos, pictures)
+            base_path: Target directory
+            expected_folder: Date folder name (YYYY_MM_DD)
+
+        Returns:
+            True if a matching date folder exists
+        """
+        wudan_prefix = expected_folder + '_'
+        try:
+            # Look for date folders in this target directory; the name is
+            # checked first so only a matching entry costs a directory test
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if path_type == 'wudan':
+                        # For Wudan folders, check YYYY_MM_DD_DDD pattern
+                        name_matches = name.startswith(wudan_prefix)
+                    else:
+                        # For regular folders, check YYYY_MM_DD pattern
+                        name_matches = name == expected_folder
+
+                    if name_matches and entry.is_dir():
+                        return True
+
+        except FileNotFoundError:
+            pass
+        except (OSError, PermissionError) as e:
+            self.logger.warning(f"Could not access target directory {base_path}: {e}")
+
+        return False
+
     def _determine_last_process_date_from_folders(self) -> Optional[datetime.date]:
+        """
+        Cached result of _find_last_process_date_in_folders for this run
+
+        Returns:
+            Most recent date found in target folders, or None if no valid dates found
+        """
+        if self._last_folder_date_cached is _NOT_CACHED:
+            self._last_folder_date_cached = self._find_last_process_date_in_folders()
+        return self._last_folder_date_cached
+
+    def _invalidate_folder_checks(self):
+        """Forget cached target folder checks (new run or changed state)"""
+        self._validation_cached = None
+        self._last_folder_date_cached = _NOT_CACHED
+
+    def _find_last_process_date_in_folders(self) -> Optional[datetime.date]:
         """
         Examine target folder structure to find the most recent YYYY_MM_DD folder
 
@@ -240,27 +599,16 @@ class ProcessingStateManager:
         """
         self.logger.info("Scanning target folders to determine last process date")
 
+        # Each target directory is listed on its own thread (they may be separate,
+        # slow network mounts)
+        target_paths = [(path_type, base_path) for path_type, base_path
+                        in self.config.get('target_paths', {}).items() if base_path]
         latest_date = None
-        target_paths = self.config.get('target_paths', {})
-
-        for path_type, base_path in target_paths.items():
-            if not base_path or not os.path.exists(base_path):
-                continue
 
-            try:
-                for item in os.listdir(base_path):
-                    item_path = os.path.join(base_path, item)
-                    if not os.path.isdir(item_path):
-                        continue
-
-                    # Parse date from folder name
-                    folder_date = self._parse_date_from_folder_name(item, path_type)
-                    if folder_date and (latest_date is None or folder_date > latest_date):
-                        latest_date = folder_date
-
-            except (OSError, PermissionError) as e:
-                self.logger.warning(f"Could not access target directory {base_path}: {e}")
-                continue
+        if target_paths:
+            with ThreadPoolExecutor(max_workers=len(target_paths)) as executor:
+                latest_date = max((folder_date for folder_date in executor.map(self._latest_date_in, target_paths)
+                                   if folder_date), default=None)
 
         if latest_date:
             self.logger.info(f"Found last process date from folders: {latest_date}")
@@ -269,6 +617,34 @@ class ProcessingStateManager:
 
         return latest_date
 
+    def _latest_date_in(self, target: Tuple[str, str]) -> Optional[date]:
+        """
+        Find the most recent date folder in one target directory
+
+        Args:
+            target: (path type, target directory)
+
+        Returns:
+            Most recent folder date, or None if there is none
+        """
+        path_type, base_path = target
+        latest_date = None
+
+        try:
+            with os.scandir(base_path) as entries:
+                for entry in entries:
+                    # Parse date from folder name; only newer dates need the directory test
+                    folder_date = self._parse_date_from_folder_name(entry.name, path_type)
+                    if folder_date and (latest_date is None or folder_date > latest_date) and entry.is_dir():
+                        latest_date = folder_date
+
+        except FileNotFoundError:
+            pass
+        except (OSError, PermissionError) as e:
+            self.logger.warning(f"Could not access target directory {base_path}: {e}")
+
+        return latest_date
+
     def _parse_date_from_folder_name(self, folder_name: str, path_type: str) -> Optional[datetime.date]:
         """
         Parse date from folder name based on expected patterns
@@ -280,25 +656,7 @@ class ProcessingStateManager:
         Returns:
             Parsed date or None if folder name doesn't match expected pattern
         """
-        try:
-            if path_type == 'wudan':
-                # Wudan folders: YYYY_MM_DD_DDD (with day of week)
-                parts = folder_name.split('_')
-                if len(parts) >= 3:
-                    year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-                    return datetime(year, month, day).date()
-            else:
-                # Regular folders: YYYY_MM_DD
-                parts = folder_name.split('_')
-                if len(parts) == 3:
-                    year, month, day = int(parts[0]), int(parts[1]), int(parts[2])
-                    return datetime(year, month, day).date()
-
-        except (ValueError, IndexError):
-            # Not a valid date folder
-            pass
-
-        return None
+        return _parse_folder_date(folder_name, path_type)
 
     def mark_file_processed(self, file_info: Dict[str, Any], analysis_result: Optional[Dict[str, Any]] = None):
         """
@@ -308,20 +666,20 @@ class ProcessingStateManager:
             file_info: File information dictionary
             analysis_result: Optional analysis result for additional tracking
         """
-        file_path = file_info['path']
-        file_date = file_info['date']
-        
         # Create unique identifier for file
-        file_id = f"{file_path}|{file_info['size']}|{file_date.isoformat()}"
+        file_id = _file_id(file_info)
         
-        # Add to processed files set
-        self.processed_files.add(file_id)
+        # Add to processed files set; only ids not seen before go to the log
+        if file_id not in self.processed_files and file_id not in self._pending_adds:
+            self._pending_adds.add(file_id)
+            self._dirty = True
         
-        self.logger.debug(f"Marked file as processed: {file_info['name']}")
+        self.logger.debug("Marked file as processed: %s", file_info['name'])
     
     def start_processing_run(self):
         """Start a new processing run"""
         self.logger.info("=== Starting new processing run ===")
+        self._invalidate_folder_checks()
         
         # Log previous state if exists
         if self.current_state:
@@ -347,6 +705,8 @@ class ProcessingStateManager:
             total_files_processed=stats.get('files_processed', 0),
             total_videos_analyzed=stats.get('videos_analyzed', 0)
         )
+        self._dirty = True
+        self._invalidate_folder_checks()
         
         # Save state to disk
         self._save_state()
@@ -354,7 +714,7 @@ class ProcessingStateManager:
         self.logger.info("=== Processing run completed ===")
         self.logger.info(f"Files processed this run: {stats.get('files_processed', 0)}")
         self.logger.info(f"Videos analyzed this run: {stats.get('videos_analyzed', 0)}")
-        self.logger.info(f"Total tracked files: {len(self.processed_files)}")
+        self.logger.info(f"Total tracked files: {len(self.processed_files) + len(self._pending_adds)}")
     
     def get_state_info(self) -> Dict[str, Any]:
         """
@@ -366,7 +726,7 @@ class ProcessingStateManager:
         if not self.current_state:
             return {
                 'first_run': True,
-                'processed_files_count': len(self.processed_files)
+                'processed_files_count': len(self.processed_files) + len(self._pending_adds)
             }
             
         return {
@@ -375,7 +735,7 @@ class ProcessingStateManager:
             'last_processed_file': self.current_state.last_processed_file,
             'total_files_processed': self.current_state.total_files_processed,
             'total_videos_analyzed': self.current_state.total_videos_analyzed,
-            'processed_files_count': len(self.processed_files)
+            'processed_files_count': len(self.processed_files) + len(self._pending_adds)
         }
     
     def reset_state(self):
@@ -384,12 +744,21 @@ class ProcessingStateManager:
         
         self.current_state = None
         self.processed_files = set()
+        self._pending_adds.clear()
+        self._dirty = False
+        self._invalidate_folder_checks()
+        self._snapshot_count = 0
+        self._log_count = 0
         
         # Remove state files
         if self.state_file.exists():
             self.state_file.unlink()
         if self.processed_files_db.exists():
             self.processed_files_db.unlink()
+        if self.processed_files_snapshot.exists():
+            self.processed_files_snapshot.unlink()
+        if self.processed_files_log.exists():
+            self.processed_files_log.unlink()
             
         self.logger.info("Processing state reset complete")
     
@@ -5,11 +5,35 @@ Converted from PowerShell Get-TargetFolderPath and Find-ExistingDateFolder funct
 """
 
 import os
+import stat
 import logging
-from pathlib import Path
-from datetime import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
 from typing import Dict, Any, Optional, Tuple
 
+from .config_manager import get_max_workers
+
+# Files arrive in runs for the same target folder; normalize each folder once
+_normpath = functools.lru_cache(maxsize=4096)(os.path.normpath)
+
+# Marks a classification not computed yet (None means unsupported)
+_NOT_CLASSIFIED = object()
+
+@functools.lru_cache(maxsize=4096)
+def _date_patterns(file_day: date) -> Tuple[str, str]:
+    """
+    Build the date folder names for a day: (2024_06_11, 2024_06_11_Wed)
+    Cached: a scan holds many files per day, and strftime is costly per call
+    
+    Args:
+        file_day: Date of the file
+        
+    Returns:
+        Tuple of (regular folder name, Wudan folder name with day of week)
+    """
+    return file_day.strftime('%Y_%m_%d'), file_day.strftime('%Y_%m_%d_%a')
+
 class TargetPathResolver:
     """
     Resolves target paths for files based on type, date, and Wudan rules
@@ -35,6 +59,26 @@ class TargetPathResolver:
         # Get target paths from config
         self.target_paths = config['target_paths']
         self.file_extensions = config['file_extensions']
+        
+        # Per-file lookups in _determine_base_path: extension sets (the scanner
+        # lowercases extensions) and the base paths themselves
+        self._picture_extensions = frozenset(ext.lower() for ext in self.file_extensions['pictures'])
+        self._video_extensions = frozenset(ext.lower() for ext in self.file_extensions['videos'])
+        self._pictures_path = self.target_paths['pictures']
+        self._videos_path = self.target_paths['videos']
+        self._wudan_path = self.target_paths['wudan']
+        
+        # Target folder -> os.path.normcase'd names known to be taken, listed on the
+        # first collision in the folder and extended with every name handed out
+        self._folder_name_cache: Dict[str, set] = {}
+        
+        # (base path, date pattern) -> resolved date folder, so each date folder is
+        # searched for once per run instead of once per file
+        self._folder_cache: Dict[Tuple[str, str], str] = {}
+        
+        # (type, extension, day or - for videos - date/time) -> (base path, date pattern),
+        # or None if unsupported; see _classify_file
+        self._classification_cache: Dict[Tuple[str, str, Any], Optional[Tuple[str, str]]] = {}
     
     def get_target_folder_path(self, file_info: Dict[str, Any], quiet: bool = False) -> Optional[str]:
         """
@@ -52,35 +96,91 @@ class TargetPathResolver:
         file_type = file_info['type']
         extension = file_info['extension']
         
-        # Determine base target path based on file type and Wudan rules
-        base_path = self._determine_base_path(file_type, extension, file_date)
+        # Determine base target path and date folder based on file type and Wudan rules
+        bucket_key = self._classify_file(file_type, extension, file_date)
 
-        if not base_path:
+        if bucket_key is None:
             self.logger.warning(f"Unsupported file extension: {extension} for file {file_path}")
             return None
 
-        # Create date pattern for folder name - add day of week for Wudan files
-        if base_path == self.target_paths['wudan']:
+        base_path, date_pattern = bucket_key
+        return self._resolve_date_folder(base_path, date_pattern, quiet=quiet)
+    
+    def _classify_file(self, file_type: str, extension: str, file_date: datetime) -> Optional[Tuple[str, str]]:
+        """
+        Get the (base path, date pattern) a file belongs in, without touching the filesystem
+        Only type, extension and day decide it - plus the time of day for videos, which
+        the Wudan rules check - so each distinct combination is evaluated once
+        
+        Args:
+            file_type: 'picture' or 'video'
+            extension: File extension (e.g., '.jpg', '.mp4')
+            file_date: Date/time of the file
+            
+        Returns:
+            Tuple of (base path, date pattern) or None if unsupported
+        """
+        cache_key = (file_type, extension, file_date if file_type == 'video' else file_date.date())
+        bucket_key = self._classification_cache.get(cache_key, _NOT_CLASSIFIED)
+        if bucket_key is _NOT_CLASSIFIED:
+            base_path = self._determine_base_path(file_type, extension, file_date)
+            bucket_key = self._classification_cache[cache_key] = (
+                (base_path, self._get_date_pattern(base_path, file_date)) if base_path else None
+            )
+        return bucket_key
+    
+    def _get_date_pattern(self, base_path: str, file_date: datetime) -> str:
+        """
+        Get the date folder name for a file - adds day of week for Wudan files
+        
+        Args:
+            base_path: Base target path from _determine_base_path
+            file_date: Date/time of the file
+            
+        Returns:
+            Date folder name (e.g., 2024_06_11 or 2024_06_11_Wed)
+        """
+        regular_pattern, wudan_pattern = _date_patterns(file_date.date())
+        if base_path == self._wudan_path:
             # For Wudan files: 2024_06_11_Wed
-            day_of_week = file_date.strftime('%a')  # Mon, Tue, Wed, etc.
-            date_pattern = file_date.strftime(f'%Y_%m_%d_{day_of_week}')
-            self.logger.debug(f"Wudan folder date pattern with day of week: {date_pattern}")
-        else:
-            # For regular files: 2024_06_11
-            date_pattern = file_date.strftime('%Y_%m_%d')
-
+            self.logger.debug("Wudan folder date pattern with day of week: %s", wudan_pattern)
+            return wudan_pattern
+        
+        # For regular files: 2024_06_11
+        return regular_pattern
+    
+    def _resolve_date_folder(self, base_path: str, date_pattern: str, quiet: bool = False) -> str:
+        """
+        Resolve the date folder under a base path, preferring an existing one
+        
+        Args:
+            base_path: Base target path
+            date_pattern: Date folder name
+            quiet: Suppress per-folder log messages
+            
+        Returns:
+            Normalized path to the existing or new date folder
+        """
+        cache_key = (base_path, date_pattern)
+        target_folder = self._folder_cache.get(cache_key)
+        if target_folder is None:
+            target_folder = self._folder_cache[cache_key] = self._find_date_folder(base_path, date_pattern, quiet)
+        return target_folder
+    
+    def _find_date_folder(self, base_path: str, date_pattern: str, quiet: bool) -> str:
+        """Search the base path for the date folder (see _resolve_date_folder)"""
         # Look for existing folder with the date pattern (allows suffixes like _PaulArt)
         existing_folder = self.dedup_manager.find_existing_date_folder(base_path, date_pattern, quiet=quiet)
 
         if existing_folder:
             if not quiet:
-                self.logger.debug(f"Using existing date folder: {existing_folder}")
+                self.logger.debug("Using existing date folder: %s", existing_folder)
             return os.path.normpath(existing_folder)
         else:
             # Return the standard date folder path if no existing folder found
             target_folder = os.path.join(base_path, date_pattern)
             if not quiet:
-                self.logger.debug(f"Will create new date folder: {target_folder}")
+                self.logger.debug("Will create new date folder: %s", target_folder)
             return os.path.normpath(target_folder)
     
     def _determine_base_path(self, file_type: str, extension: str, file_date: datetime) -> Optional[str]:
@@ -96,18 +196,18 @@ class TargetPathResolver:
             Base path string or None if unsupported
         """
         if file_type == 'picture':
-            if extension in self.file_extensions['pictures']:
-                return self.target_paths['pictures']
+            if extension in self._picture_extensions:
+                return self._pictures_path
         
         elif file_type == 'video':
-            if extension in self.file_extensions['videos']:
+            if extension in self._video_extensions:
                 # Check Wudan rules for videos
                 if self.wudan_engine.should_go_to_wudan_folder(file_date):
-                    self.logger.debug(f"Video matches Wudan rules: {file_date}")
-                    return self.target_paths['wudan']
+                    self.logger.debug("Video matches Wudan rules: %s", file_date)
+                    return self._wudan_path
                 else:
-                    self.logger.debug(f"Video does not match Wudan rules: {file_date}")
-                    return self.target_paths['videos']
+                    self.logger.debug("Video does not match Wudan rules: %s", file_date)
+                    return self._videos_path
         
         return None
     
@@ -122,15 +222,20 @@ class TargetPathResolver:
         Returns:
             True if directory exists or was created successfully, False otherwise
         """
-        if os.path.exists(target_path):
+        # Existing folders (the common case) cost one stat; makedirs would stat the
+        # parent and attempt a mkdir before finding out
+        if os.path.isdir(target_path):
             return True
         
         if self.config['options']['create_missing_folders']:
             try:
+                # exist_ok covers a folder created by another process since the check
                 os.makedirs(target_path, exist_ok=True)
-                self.logger.info(f"Created directory: {target_path}")
+                self.logger.info("Created directory: %s", target_path)
+                # A new folder may be a date folder another pattern would now match
+                self._folder_cache.clear()
                 return True
-            except Exception as e:
+            except OSError as e:
                 self.logger.error(f"Failed to create directory {target_path}: {e}")
                 return False
         else:
@@ -150,20 +255,45 @@ class TargetPathResolver:
         """
         original_filename = file_info['name']
         # Normalize the target folder path to use consistent separators
-        normalized_target_folder = os.path.normpath(target_folder)
+        normalized_target_folder = _normpath(target_folder)
         target_file_path = os.path.join(normalized_target_folder, original_filename)
         
         # If file doesn't exist, use original name
         if not os.path.exists(target_file_path):
+            taken_names = self._folder_name_cache.get(normalized_target_folder)
+            if taken_names is not None:
+                taken_names.add(os.path.normcase(original_filename))
             return target_file_path, original_filename
         
         # Handle name collision by creating unique filename
         return self._create_unique_filename(normalized_target_folder, original_filename, file_info)
     
+    def _get_taken_names(self, target_folder: str) -> set:
+        """
+        Get the names taken in a target folder, listing it once per run
+        
+        Args:
+            target_folder: Normalized target folder path
+            
+        Returns:
+            Set of os.path.normcase'd entry names
+        """
+        taken_names = self._folder_name_cache.get(target_folder)
+        if taken_names is None:
+            try:
+                with os.scandir(target_folder) as entries:
+                    taken_names = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                taken_names = set()
+            self._folder_name_cache[target_folder] = taken_names
+        return taken_names
+    
     def _create_unique_filename(self, target_folder: str, original_filename: str, 
                               file_info: Dict[str, Any]) -> Tuple[str, str]:
         """
         Create unique filename to avoid collisions
+        Counters are probed against a listing of the folder; only the chosen name
+        is checked on disk, in case the folder changed since it was listed
         
         Args:
             target_folder: Target folder path
@@ -173,17 +303,22 @@ class TargetPathResolver:
         Returns:
             Tuple of (unique_file_path, unique_filename)
         """
-        base_name = Path(original_filename).stem
-        extension = Path(original_filename).suffix
+        base_name, extension = os.path.splitext(original_filename)
+        taken_names = self._get_taken_names(target_folder)
+        taken_names.add(os.path.normcase(original_filename))
         counter = 1
         
         while True:
             unique_filename = f"{base_name}_{counter}{extension}"
-            unique_file_path = os.path.normpath(os.path.join(target_folder, unique_filename))
+            name_key = os.path.normcase(unique_filename)
 
-            if not os.path.exists(unique_file_path):
-                self.logger.info(f"Created unique filename to avoid collision: {unique_filename}")
-                return unique_file_path, unique_filename
+            if name_key not in taken_names:
+                # target_folder is already normalized and a file name has no separators
+                unique_file_path = os.path.join(target_folder, unique_filename)
+                taken_names.add(name_key)
+                if not os.path.exists(unique_file_path):
+                    self.logger.info("Created unique filename to avoid collision: %s", unique_filename)
+                    return unique_file_path, unique_filename
             
             counter += 1
             
@@ -219,50 +354,81 @@ class TargetPathResolver:
             'target_folders_needed': set()
         }
         
+        # Target type for each base path _determine_base_path can return
+        target_types = {
+            self._pictures_path: 'pictures',
+            self._videos_path: 'videos',
+            self._wudan_path: 'wudan_videos',
+        }
+        
+        # First pass: classify each file into its (base path, date folder) bucket
+        # without touching the filesystem
+        buckets = {}
         for file_info in files:
             try:
-                target_folder = self.get_target_folder_path(file_info)
+                extension = file_info['extension']
+                file_date = file_info['date']
+                bucket_key = self._classify_file(file_info['type'], extension, file_date)
                 
-                if not target_folder:
+                if bucket_key is None:
+                    self.logger.warning(f"Unsupported file extension: {extension} for file {file_info['path']}")
                     analysis['by_target_type']['unsupported'] += 1
                     continue
                 
-                # Determine target type
-                if self.target_paths['pictures'] in target_folder:
-                    target_type = 'pictures'
-                elif self.target_paths['wudan'] in target_folder:
-                    target_type = 'wudan'
-                    analysis['wudan_matches'] += 1
-                elif self.target_paths['videos'] in target_folder:
-                    target_type = 'videos'
-                else:
-                    target_type = 'unsupported'
-                
-                analysis['by_target_type'][target_type] += 1
-                analysis['target_folders_needed'].add(target_folder)
-                
-                # Track by date
-                date_key = file_info['date'].strftime('%Y-%m-%d')
-                if date_key not in analysis['by_date']:
-                    analysis['by_date'][date_key] = {
-                        'pictures': 0, 'videos': 0, 'wudan_videos': 0
-                    }
-                analysis['by_date'][date_key][target_type] += 1
+                if bucket_key not in buckets:
+                    buckets[bucket_key] = []
+                buckets[bucket_key].append(file_date)
                 
             except Exception as e:
                 self.logger.warning(f"Error analyzing target for {file_info.get('path', 'unknown')}: {e}")
                 analysis['by_target_type']['unsupported'] += 1
         
+        # Second pass: resolve each date folder once (folder listings run on worker
+        # threads), then count its files on this thread
+        resolved = {}
+        if buckets:
+            max_workers = get_max_workers(self.config)
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(buckets))) as executor:
+                for bucket_key in buckets:
+                    resolved[bucket_key] = executor.submit(self._resolve_date_folder, *bucket_key)
+        
+        for (base_path, date_pattern), file_dates in buckets.items():
+            try:
+                target_folder = resolved[(base_path, date_pattern)].result()
+            except Exception as e:
+                self.logger.warning(f"Error analyzing target folder {date_pattern} in {base_path}: {e}")
+                analysis['by_target_type']['unsupported'] += len(file_dates)
+                continue
+            
+            target_type = target_types[base_path]
+            if target_type == 'wudan_videos':
+                analysis['wudan_matches'] += len(file_dates)
+            
+            analysis['by_target_type'][target_type] += len(file_dates)
+            analysis['target_folders_needed'].add(target_folder)
+            
+            # Track by date (every file in a bucket is from the same day)
+            date_key = file_dates[0].strftime('%Y-%m-%d')
+            if date_key not in analysis['by_date']:
+                analysis['by_date'][date_key] = {
+                    'pictures': 0, 'videos': 0, 'wudan_videos': 0
+                }
+            analysis['by_date'][date_key][target_type] += len(file_dates)
+        
         # Convert set to list for JSON serialization
         analysis['target_folders_needed'] = list(analysis['target_folders_needed'])
         analysis['folders_to_create'] = len(analysis['target_folders_needed'])
         
         return analysis
     
-    def validate_target_paths(self) -> Dict[str, Any]:
+    def validate_target_paths(self, strict: bool = False) -> Dict[str, Any]:
         """
         Validate that all target paths are accessible
         
+        Args:
+            strict: Test writability by creating and removing a file instead of
+                    os.access (slower, but honours ACLs and read-only network shares)
+        
         Returns:
             Dictionary with validation results
         """
@@ -274,24 +440,24 @@ class TargetPathResolver:
         
         for path_type, path_value in self.target_paths.items():
             try:
-                path_obj = Path(path_value)
+                # One stat call answers both exists and is_directory
+                try:
+                    path_mode = os.stat(path_value).st_mode
+                except (FileNotFoundError, NotADirectoryError):
+                    path_mode = None
+                parent_path = os.path.dirname(os.path.normpath(path_value)) or os.curdir
                 
                 result = {
-                    'exists': path_obj.exists(),
-                    'is_directory': path_obj.is_dir() if path_obj.exists() else None,
+                    'exists': path_mode is not None,
+                    'is_directory': stat.S_ISDIR(path_mode) if path_mode is not None else None,
                     'writable': None,
-                    'parent_exists': path_obj.parent.exists()
+                    'parent_exists': os.path.exists(parent_path)
                 }
                 
                 # Test writability if directory exists
                 if result['exists'] and result['is_directory']:
-                    try:
-                        test_file = path_obj / '.write_test'
-                        test_file.touch()
-                        test_file.unlink()
-                        result['writable'] = True
-                    except Exception:
-                        result['writable'] = False
+                    result['writable'] = self._is_writable(path_value, strict)
+                    if not result['writable']:
                         validation['all_valid'] = False
                         validation['errors'].append(f"{path_type}: Not writable - {path_value}")
                 
@@ -312,3 +478,27 @@ class TargetPathResolver:
                 validation['results'][path_type] = {'error': str(e)}
         
         return validation
+    
+    @staticmethod
+    def _is_writable(directory: str, strict: bool) -> bool:
+        """
+        Check whether files can be created in a directory
+        
+        Args:
+            directory: Directory path
+            strict: Create and remove a test file instead of asking os.access
+            
+        Returns:
+            True if the directory is writable
+        """
+        if not strict:
+            return os.access(directory, os.W_OK | os.X_OK)
+        
+        try:
+            test_file = os.path.join(directory, '.write_test')
+            with open(test_file, 'a'):
+                pass
+            os.unlink(test_file)
+            return True
+        except Exception:
+            return False
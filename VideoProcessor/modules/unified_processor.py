@@ -7,6 +7,7 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime
+from functools import cached_property
 from typing import Dict, Any, List, Optional, Tuple
 
 from .file_scanner import FileScanner
@@ -14,11 +15,6 @@ from .wudan_rules import WudanRulesEngine
 from .deduplication import DeduplicationManager
 from .target_path_resolver import TargetPathResolver
 from .file_organizer import FileOrganizer
-from .video_analyzer import VideoAnalyzer
-from .processing_state_manager import ProcessingStateManager
-from .fast_batch_processor import FastBatchProcessor
-from .batch_file_copier import BatchFileCopier
-from .batch_target_resolver import BatchTargetResolver
 
 class UnifiedProcessor:
     """
@@ -43,11 +39,9 @@ class UnifiedProcessor:
         self.deduplication = DeduplicationManager(config, logger)
         self.target_resolver = TargetPathResolver(config, logger, self.wudan_rules, self.deduplication)
         self.file_organizer = FileOrganizer(config, logger, self.target_resolver, self.deduplication)
-        self.video_analyzer = VideoAnalyzer(config, logger)
-        self.state_manager = ProcessingStateManager(config, logger)
-        self.fast_batch_processor = FastBatchProcessor(config, logger)
-        self.batch_file_copier = BatchFileCopier(config, logger)
-        self.batch_target_resolver = BatchTargetResolver(config, logger)
+        # The video analyzer, state manager and batch modules are created on first use
+        # (see the properties below), so test_all_systems and early-exit runs don't pay
+        # for importing requests or loading the processing state
         
         # Processing statistics
         self.stats = {
@@ -64,6 +58,36 @@ class UnifiedProcessor:
         }
         
         self.logger.info("UnifiedProcessor initialized successfully")
+
+    @cached_property
+    def video_analyzer(self):
+        """VideoAnalyzer instance, created on first use"""
+        from .video_analyzer import VideoAnalyzer
+        return VideoAnalyzer(self.config, self.logger)
+
+    @cached_property
+    def state_manager(self):
+        """ProcessingStateManager instance, created on first use"""
+        from .processing_state_manager import ProcessingStateManager
+        return ProcessingStateManager(self.config, self.logger)
+
+    @cached_property
+    def fast_batch_processor(self):
+        """FastBatchProcessor instance, created on first use"""
+        from .fast_batch_processor import FastBatchProcessor
+        return FastBatchProcessor(self.config, self.logger)
+
+    @cached_property
+    def batch_file_copier(self):
+        """BatchFileCopier instance, created on first use"""
+        from .batch_file_copier import BatchFileCopier
+        return BatchFileCopier(self.config, self.logger)
+
+    @cached_property
+    def batch_target_resolver(self):
+        """BatchTargetResolver instance, created on first use"""
+        from .batch_target_resolver import BatchTargetResolver
+        return BatchTargetResolver(self.config, self.logger)
     
     def process_all_sources(self) -> Dict[str, Any]:
         """
@@ -79,11 +103,6 @@ class UnifiedProcessor:
         try:
             # Start processing run in state manager
             self.state_manager.start_processing_run()
-
-            # Build deduplication cache first
-            self.logger.info("Building deduplication cache...")
-            cached_files = self.deduplication.build_cache()
-            self.logger.info(f"Cache built: {cached_files} existing files indexed")
             
             # Process each source folder
             all_results = []
@@ -101,9 +120,9 @@ class UnifiedProcessor:
                 self.logger.info("No supported files found in any source folder")
                 return all_results
 
-            # Step 2: Build target file inventory using fast scanning
-            target_paths = self.config.get('target_paths', {})
-            target_files_set = self.fast_batch_processor.build_target_inventory(target_paths)
+            # Step 2: Build deduplication cache and target file inventory from one target walk
+            self.logger.info("Building deduplication cache and target inventory...")
+            target_files_set = self.fast_batch_processor.build_target_indices(self.deduplication)
 
             # Step 3: Use set operations to find files needing processing (lightning fast!)
             files_needing_processing_set = self.fast_batch_processor.find_files_needing_processing(
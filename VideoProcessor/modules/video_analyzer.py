@@ -9,6 +9,7 @@ import base64
 import logging
 import subprocess
 import tempfile
+import threading
 import requests
 from pathlib import Path
 from datetime import datetime
@@ -50,6 +51,23 @@ class VideoAnalyzer:
             'analysis_failures': 0,
             'thumbnails_extracted': 0
         }
+        # analyze_video may run on several threads at once (see generate_ai_notes.py)
+        self._stats_lock = threading.Lock()
+        
+        # One keep-alive HTTP session per analysis thread (Session is not thread-safe)
+        self._thread_local = threading.local()
+
+    def _count(self, stat_name: str):
+        """Increment a statistics counter (thread-safe)"""
+        with self._stats_lock:
+            self.stats[stat_name] += 1
+
+    def _get_session(self) -> requests.Session:
+        """Get this thread's HTTP session, reusing its connection to LM Studio"""
+        session = getattr(self._thread_local, 'session', None)
+        if session is None:
+            session = self._thread_local.session = requests.Session()
+        return session
 
     def should_analyze_video(self, video_path: str) -> bool:
         """
@@ -114,13 +132,13 @@ class VideoAnalyzer:
             # Extract thumbnail from video
             thumbnail_data = self._extract_thumbnail(video_path)
             if not thumbnail_data:
-                self.stats['analysis_failures'] += 1
+                self._count('analysis_failures')
                 return {
                     'analyzed': False,
                     'reason': 'Failed to extract thumbnail'
                 }
 
-            self.stats['thumbnails_extracted'] += 1
+            self._count('thumbnails_extracted')
 
             # Create file_info from video_path for AI analysis
             file_info = {
@@ -133,13 +151,13 @@ class VideoAnalyzer:
             analysis_result = self._analyze_thumbnail_with_ai(thumbnail_data, file_info)
             
             if analysis_result['success']:
-                self.stats['videos_analyzed'] += 1
+                self._count('videos_analyzed')
                 
                 if analysis_result['is_kung_fu']:
-                    self.stats['kung_fu_detected'] += 1
+                    self._count('kung_fu_detected')
                 
                 if analysis_result.get('note_generated'):
-                    self.stats['notes_generated'] += 1
+                    self._count('notes_generated')
                 
                 return {
                     'analyzed': True,
@@ -150,7 +168,7 @@ class VideoAnalyzer:
                     'analysis_timestamp': datetime.now().isoformat()
                 }
             else:
-                self.stats['analysis_failures'] += 1
+                self._count('analysis_failures')
                 return {
                     'analyzed': False,
                     'reason': f"AI analysis failed: {analysis_result.get('error', 'Unknown error')}"
@@ -158,7 +176,7 @@ class VideoAnalyzer:
                 
         except Exception as e:
             self.logger.error(f"Error analyzing video {video_path}: {e}")
-            self.stats['analysis_failures'] += 1
+            self._count('analysis_failures')
             return {
                 'analyzed': False,
                 'reason': f"Analysis error: {str(e)}"
@@ -383,8 +401,8 @@ Date: {file_date.strftime('%Y-%m-%d %H:%M:%S')}
                 "max_tokens": self.ai_settings['max_tokens']
             }
             
-            # Make request to LM Studio
-            response = requests.post(
+            # Make request to LM Studio (kept-alive connection, no TCP setup per video)
+            response = self._get_session().post(
                 self.lm_studio_url,
                 json=payload,
                 timeout=self.ai_settings['timeout_seconds']
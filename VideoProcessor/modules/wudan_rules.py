@@ -90,8 +90,8 @@ class WudanRulesEngine:
         # Convert Python weekday to PowerShell format (Sunday=0, Monday=1, etc.)
         powershell_day_of_week = (day_of_week + 1) % 7
         
-        self.logger.debug(f"Checking Wudan rules for {file_date}: "
-                         f"Year={year}, DayOfWeek={powershell_day_of_week}, Time={file_time}")
+        self.logger.debug("Checking Wudan rules for %s: Year=%s, DayOfWeek=%s, Time=%s",
+                          file_date, year, powershell_day_of_week, file_time)
         
         # Determine which rule set to use
         if year < 2021:
@@ -114,16 +114,16 @@ class WudanRulesEngine:
         
         # Check if day of week matches
         if day_of_week not in rules['days_of_week']:
-            self.logger.debug(f"Day {day_of_week} not in before_2021 days: {rules['days_of_week']}")
+            self.logger.debug("Day %s not in before_2021 days: %s", day_of_week, rules['days_of_week'])
             return False
         
         # Check if time falls within any of the time ranges
         for start_time, end_time in rules['time_ranges']:
             if self._time_in_range(file_time, start_time, end_time):
-                self.logger.debug(f"Time {file_time} matches before_2021 range: {start_time}-{end_time}")
+                self.logger.debug("Time %s matches before_2021 range: %s-%s", file_time, start_time, end_time)
                 return True
         
-        self.logger.debug(f"Time {file_time} does not match any before_2021 time ranges")
+        self.logger.debug("Time %s does not match any before_2021 time ranges", file_time)
         return False
     
     def _check_after_2021_rules(self, day_of_week: int, file_time: time) -> bool:
@@ -141,23 +141,24 @@ class WudanRulesEngine:
         
         # Check if day of week matches
         if day_of_week not in rules['days_of_week']:
-            self.logger.debug(f"Day {day_of_week} not in after_2021 days: {rules['days_of_week']}")
+            self.logger.debug("Day %s not in after_2021 days: %s", day_of_week, rules['days_of_week'])
             return False
         
         # Get day-specific time ranges
         day_time_ranges = rules['time_ranges'].get(day_of_week, [])
         
         if not day_time_ranges:
-            self.logger.debug(f"No time ranges defined for day {day_of_week} in after_2021 rules")
+            self.logger.debug("No time ranges defined for day %s in after_2021 rules", day_of_week)
             return False
         
         # Check if time falls within any of the day-specific time ranges
         for start_time, end_time in day_time_ranges:
             if self._time_in_range(file_time, start_time, end_time):
-                self.logger.debug(f"Time {file_time} matches after_2021 range for day {day_of_week}: {start_time}-{end_time}")
+                self.logger.debug("Time %s matches after_2021 range for day %s: %s-%s",
+                                  file_time, day_of_week, start_time, end_time)
                 return True
         
-        self.logger.debug(f"Time {file_time} does not match any after_2021 time ranges for day {day_of_week}")
+        self.logger.debug("Time %s does not match any after_2021 time ranges for day %s", file_time, day_of_week)
         return False
     
     def _time_in_range(self, check_time: time, start_time: time, end_time: time) -> bool:
@@ -230,11 +230,18 @@ def main():
         action='store_true',
         help='Enable verbose logging'
     )
+    parser.add_argument(
+        '--rebuild-cache',
+        action='store_true',
+        help='Rescan every target folder instead of reusing the saved deduplication cache'
+    )
     
     args = parser.parse_args()
     
     try:
         processor = PhoneSyncProcessor(args.config)
+        if args.rebuild_cache:
+            processor.dedup_manager.invalidate_persisted_cache()
         success = processor.run(dry_run=args.dry_run, verbose=args.verbose)
         
         sys.exit(0 if success else 1)